@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Simulation de plusieurs cadrans sur un même journal de rotations : chaque
+configuration (position de départ, taille du cadran) reçoit ses zéros des
+parties 1 et 2.
+
+Le journal n'est parcouru qu'une fois (sommes cumulées de stream.prefix_terms).
+Ensuite chaque taille de cadran distincte coûte un comptage sur ces
+tableaux, et chaque configuration une simple lecture. Donc 10 000 départs
+sur un cadran de 100 coûtent à peine plus qu'un seul.
+
+Usage :
+
+    python day1/multidial.py day1/inputs.txt --configs 50:100 0:100 3:7
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from stream import _summarize_loop, entry_counts, np, parse_chunk, prefix_terms
+from tools.parsing import read_bytes
+
+# Au-delà, les histogrammes de taille modulus coûtent plus cher qu'un tri.
+BINCOUNT_MAX_MODULUS = 1 << 16
+
+
+def read_log(path) -> Tuple[bytes, Sequence[int]]:
+    return parse_chunk(read_bytes(path))
+
+
+def _sorted_counts(after, plus, minus, modulus: int, starts):
+    # Même comptage que entry_counts, mais par recherche dans des résidus
+    # triés : rien n'est alloué en O(modulus).
+    landed = np.sort(after % modulus)
+    plus_r, minus_r = np.sort(plus % modulus), np.sort(minus % modulus)
+    base = int((plus // modulus).sum() - (minus // modulus).sum())
+
+    target = -starts % modulus
+    part1 = np.searchsorted(landed, target, "right") - np.searchsorted(landed, target, "left")
+    threshold = modulus - starts  # résidus r >= m - s (s dans 0..m-1)
+
+    def above(residues):
+        return len(residues) - np.searchsorted(residues, threshold, "left")
+
+    part2 = base + above(plus_r) - above(minus_r)
+    return part1, part2
+
+
+def simulate_dials(letters, numbers, starts, moduli):
+    """
+    Zéros des parties 1 et 2 pour chaque configuration (starts[i], moduli[i]).
+    letters : bytes b"LR..." ou liste de 'L'/'R'. Retourne deux tableaux
+    int64 (NumPy) ou deux listes (sans NumPy), dans l'ordre des configurations.
+    """
+    if not isinstance(letters, (bytes, bytearray)):
+        letters = "".join(letters).encode("ascii")
+    if any(m < 1 for m in moduli):
+        raise ValueError("taille de cadran < 1")
+
+    if np is None:
+        part1, part2 = [0] * len(starts), [0] * len(starts)
+        by_modulus = {}
+        for i, (s, m) in enumerate(zip(starts, moduli)):
+            if m not in by_modulus:
+                by_modulus[m] = _summarize_loop(letters, numbers, m)
+            _, zeros1, zeros2 = by_modulus[m]
+            part1[i], part2[i] = zeros1[s % m], zeros2[s % m]
+        return part1, part2
+
+    starts = np.asarray(starts, dtype=np.int64)
+    moduli = np.asarray(moduli, dtype=np.int64)
+    after, plus, minus = prefix_terms(letters, numbers)
+    part1 = np.zeros(len(starts), dtype=np.int64)
+    part2 = np.zeros(len(starts), dtype=np.int64)
+    for m in np.unique(moduli).tolist():
+        idx = np.flatnonzero(moduli == m)
+        entries = starts[idx] % m
+        if m <= BINCOUNT_MAX_MODULUS:
+            zeros1, zeros2 = entry_counts(after, plus, minus, m)
+            part1[idx], part2[idx] = zeros1[entries], zeros2[entries]
+        else:
+            part1[idx], part2[idx] = _sorted_counts(after, plus, minus, m, entries)
+    return part1, part2
+
+
+def parse_config(text: str) -> Tuple[int, int]:
+    start, _, modulus = text.partition(":")
+    return int(start), int(modulus or 100)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Plusieurs cadrans (départ:taille) sur un même journal.")
+    parser.add_argument("path", nargs="?", default=str(Path(__file__).resolve().parent / "inputs.txt"))
+    parser.add_argument("--configs", nargs="+", default=["50:100"], help="départ:taille, ex. 50:100 0:7")
+    args = parser.parse_args()
+
+    configs = [parse_config(c) for c in args.configs]
+    letters, numbers = read_log(args.path)
+    part1, part2 = simulate_dials(letters, numbers, [s for s, _ in configs], [m for _, m in configs])
+    for (start, modulus), zeros1, zeros2 in zip(configs, part1, part2):
+        print(f"{start}:{modulus} {zeros1} {zeros2}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,58 @@
 import argparse
+import sys
+from array import array
+from pathlib import Path
 
-def read_file_split_letters_numbers(filepath):
-    letters = []
-    numbers = []
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.parsing import read_letter_numbers
+from tools.sidecar import load_sidecar
+
+try:
+    import numpy as np
+except ImportError:  # NumPy reste optionnel : on garde la boucle
+    np = None
+
+# En dessous, la boucle Python va plus vite que la conversion en tableaux.
+NUMPY_MIN_ROTATIONS = 2000
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+def read_file_split_letters_numbers(filepath):
+    # Sidecar binaire à jour (python -m tools.sidecar) : pas de parsing texte
+    arrays = load_sidecar(filepath, required=("letters", "numbers"))
+    if arrays is not None:
+        return from_sidecar(arrays)
+    return read_letter_numbers(filepath)
 
-            letter = line[0]
-            number = int(line[1:])
-            letters.append(letter)
-            numbers.append(number)
+def to_sidecar(data):
+    letters, numbers = data
+    return {"letters": array("B", "".join(letters).encode("ascii")), "numbers": array("q", numbers)}
 
-    return letters, numbers
+def from_sidecar(arrays):
+    return list(arrays["letters"].tobytes().decode("ascii")), arrays["numbers"]
 
 def get_new_position(lastPosition, letter, number):
     if letter == 'L':
         return (lastPosition-number+100)%100
     return (lastPosition+number)%100
 
-def get_solution(letters, numbers):
+def signed_deltas(letters, numbers):
+    # L -> -n, R -> +n, réduits modulo 100 : un seul tableau int64
+    is_left = np.frombuffer("".join(letters).encode("ascii"), dtype=np.uint8) == ord('L')
+    deltas = np.asarray(numbers, dtype=np.int64) % 100
+    return np.where(is_left, -deltas, deltas)
+
+def get_solution_numpy(letters, numbers, start=50):
+    # Position après chaque rotation = (départ + somme cumulée) mod 100
+    positions = (start + np.cumsum(signed_deltas(letters, numbers))) % 100
+    return int(np.count_nonzero(positions == 0))
+
+def get_solution(letters, numbers, engine="auto"):
+    # engine : "auto", "numpy" ou "loop" (chemin de référence)
+    if engine == "numpy" or (engine == "auto" and np is not None and len(letters) >= NUMPY_MIN_ROTATIONS):
+        return get_solution_numpy(letters, numbers)
+    return get_solution_loop(letters, numbers)
+
+def get_solution_loop(letters, numbers):
     position=50
 
     solution = 0
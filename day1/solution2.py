@@ -1,62 +1,85 @@
 import argparse
+import sys
+from array import array
+from pathlib import Path
 
-def read_file_split_letters_numbers(filepath):
-    letters = []
-    numbers = []
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+from tools.parsing import read_letter_numbers
+from tools.sidecar import load_sidecar
 
-            letter = line[0]
-            number = int(line[1:])
-            letters.append(letter)
-            numbers.append(number)
+try:
+    import numpy as np
+except ImportError:  # NumPy reste optionnel : on garde la boucle
+    np = None
 
-    return letters, numbers
+# En dessous, la boucle Python va plus vite que la conversion en tableaux.
+NUMPY_MIN_ROTATIONS = 2000
 
-def get_new_position(lastPosition, letter, number):
+def read_file_split_letters_numbers(filepath):
+    # Sidecar binaire à jour (python -m tools.sidecar) : pas de parsing texte
+    arrays = load_sidecar(filepath, required=("letters", "numbers"))
+    if arrays is not None:
+        return from_sidecar(arrays)
+    return read_letter_numbers(filepath)
+
+def to_sidecar(data):
+    letters, numbers = data
+    return {"letters": array("B", "".join(letters).encode("ascii")), "numbers": array("q", numbers)}
+
+def from_sidecar(arrays):
+    return list(arrays["letters"].tobytes().decode("ascii")), arrays["numbers"]
+
+def count_zero_hits(position, letter, number):
+    # position non bornée (jamais ramenée dans 0..99) : le cadran est sur 0
+    # à chaque multiple de 100 atteint. Droite : multiples dans ]p, p+n] ;
+    # gauche : multiples dans [p-n, p[.
     if letter == 'L':
-        if lastPosition == 0:
-            return lastPosition-number+100
-        return lastPosition-number
-    return lastPosition+number
+        return (position-1)//100 - (position-number-1)//100
+    return (position+number)//100 - position//100
 
-def get_solution(letters, numbers):
+def get_solution_loop(letters, numbers, trace=False):
     position=50
 
     solution = 0
 
     for i in range(len(letters)):
-        position = get_new_position(position, letters[i], numbers[i]%100)
-
-        if numbers[i]//100 > 0:
-            solution+=numbers[i]//100
-
-        print(letters[i], numbers[i])
-        print("position",position)
-
-        if position == 0:
-            solution+=1
-        if position > 99:
-            solution+=1
-            position=position%100
-        if position <0:
-            solution+=1
-            position=(position+100)%100
-        print("real position",position)
-
-        print("solution", solution)
-    
+        hits = count_zero_hits(position, letters[i], numbers[i])
+        solution += hits
+        position += -numbers[i] if letters[i] == 'L' else numbers[i]
+
+        if trace:
+            print(letters[i], numbers[i], "position", position%100, "zéros", hits, "solution", solution)
+
     return solution
 
+def get_solution_numpy(letters, numbers, start=50):
+    # Même calcul, par lots : positions non bornées par somme cumulée
+    is_left = np.frombuffer("".join(letters).encode("ascii"), dtype=np.uint8) == ord('L')
+    steps = np.asarray(numbers, dtype=np.int64)
+    positions = np.empty(len(steps)+1, dtype=np.int64)
+    positions[0] = start
+    np.cumsum(np.where(is_left, -steps, steps), out=positions[1:])
+    positions[1:] += start
+    before, after = positions[:-1], positions[1:]
+    hits = np.where(is_left, (before-1)//100 - (after-1)//100, after//100 - before//100)
+    return int(hits.sum())
+
+def get_solution(letters, numbers, engine="auto", trace=False):
+    # engine : "auto", "numpy" ou "loop" ; trace=True affiche chaque rotation (boucle)
+    if not trace and (engine == "numpy" or (engine == "auto" and np is not None and len(letters) >= NUMPY_MIN_ROTATIONS)):
+        return get_solution_numpy(letters, numbers)
+    return get_solution_loop(letters, numbers, trace)
+
 
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trace", action="store_true", help="affiche chaque rotation")
+    args = parser.parse_args()
+
     letters, numbers = read_file_split_letters_numbers("inputs.txt")
 
-    print(get_solution(letters, numbers))
+    print(get_solution(letters, numbers, trace=args.trace))
 
 
 if __name__ == "__main__":
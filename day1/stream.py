@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Mode flux pour day1, pour les journaux de rotations plus gros que la mémoire.
+
+L'état du cadran se réduit à sa position modulo 100 et les rotations se
+composent : un morceau du journal se résume par son décalage net et, pour
+chacune des 100 positions d'entrée possibles, le nombre de zéros de la
+partie 1 et de la partie 2. Les morceaux (tranches du fichier projeté en
+mémoire, coupées sur des fins de ligne) sont résumés en parallèle dans un
+pool de processus, puis recollés dans l'ordre en partant de 50.
+
+Usage :
+
+    python day1/stream.py day1/inputs.txt --workers 8 --chunk-mb 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.parsing import mapped, split_ints
+
+try:
+    import numpy as np
+except ImportError:  # NumPy reste optionnel
+    np = None
+
+DIAL = 100
+DEFAULT_CHUNK_BYTES = 64 << 20
+
+# (décalage net, zéros partie 1 par position d'entrée, zéros partie 2 par position d'entrée)
+Summary = Tuple[int, List[int], List[int]]
+
+
+def chunk_bounds(mm, chunk_bytes: int) -> List[Tuple[int, int]]:
+    """Tranches [début, fin) d'environ chunk_bytes, coupées juste après un '\\n'."""
+    bounds = []
+    start, size = 0, len(mm)
+    while start < size:
+        end = mm.find(b"\n", min(start + chunk_bytes, size) - 1)
+        end = size if end == -1 else end + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def parse_chunk(data: bytes) -> Tuple[bytes, List[int]]:
+    """b'L68\\nR5\\n' -> (b'LR', [68, 5])."""
+    letters = data.translate(None, b"0123456789 \t\r\n")
+    numbers = split_ints(data.translate(None, b"LR"))
+    if len(letters) != len(numbers):
+        raise ValueError("rotation mal formée dans le morceau")
+    return letters, numbers
+
+
+def prefix_terms(letters: bytes, numbers):
+    """
+    Positions relatives (départ 0) avant/après chaque rotation, sous la forme
+    des deux termes de comptage de la partie 2 : depuis l'entrée e, une
+    rotation touche 0 F(e+plus) - F(e+minus) fois, avec F(x) = x // m
+    (à droite plus=après, minus=avant ; à gauche plus=avant-1, minus=après-1).
+    """
+    is_left = np.frombuffer(letters, dtype=np.uint8) == ord("L")
+    steps = np.asarray(numbers, dtype=np.int64)
+    signed = np.where(is_left, -steps, steps)
+    after = np.cumsum(signed)
+    before = after - signed
+    plus = np.where(is_left, before - 1, after)
+    minus = np.where(is_left, after - 1, before)
+    return after, plus, minus
+
+
+def entry_counts(after, plus, minus, modulus: int = DIAL):
+    """Zéros des parties 1 et 2 pour chaque position d'entrée 0..modulus-1 (tableaux NumPy)."""
+    # F(e+x) = F(x) + [x mod m >= m - e] : on somme les F(x) et on garde
+    # l'histogramme signé des x mod m.
+    base = int((plus // modulus).sum() - (minus // modulus).sum())
+    hist = np.bincount(plus % modulus, minlength=modulus) - np.bincount(minus % modulus, minlength=modulus)
+    suffix = np.zeros(modulus + 1, dtype=np.int64)  # suffix[k] = somme des hist[r >= k]
+    suffix[:modulus] = np.cumsum(hist[::-1])[::-1]
+    entries = np.arange(modulus)
+    part2 = base + suffix[modulus - entries]
+
+    # Partie 1 : position e + after ≡ 0 après la rotation.
+    landed = np.bincount(after % modulus, minlength=modulus)
+    part1 = landed[-entries % modulus]
+    return part1, part2
+
+
+def _summarize_numpy(letters: bytes, numbers, modulus: int = DIAL) -> Summary:
+    after, plus, minus = prefix_terms(letters, numbers)
+    part1, part2 = entry_counts(after, plus, minus, modulus)
+    net = int(after[-1]) if len(after) else 0
+    return net, part1.tolist(), part2.tolist()
+
+
+def _summarize_loop(letters: bytes, numbers, modulus: int = DIAL) -> Summary:
+    # Même calcul qu'en NumPy, rotation par rotation.
+    landed = [0] * modulus
+    hist = [0] * modulus
+    base = 0
+    position = 0
+    for letter, number in zip(letters, numbers):
+        before = position
+        if letter == ord("L"):
+            position -= number
+            plus, minus = before - 1, position - 1
+        else:
+            position += number
+            plus, minus = position, before
+        base += plus // modulus - minus // modulus
+        hist[plus % modulus] += 1
+        hist[minus % modulus] -= 1
+        landed[position % modulus] += 1
+
+    suffix = [0] * (modulus + 1)
+    for k in range(modulus - 1, -1, -1):
+        suffix[k] = suffix[k + 1] + hist[k]
+    part2 = [base + suffix[modulus - e] for e in range(modulus)]
+    part1 = [landed[-e % modulus] for e in range(modulus)]
+    return position, part1, part2
+
+
+def summarize_rotations(letters: bytes, numbers, modulus: int = DIAL) -> Summary:
+    """Décalage net et zéros (parties 1 et 2) pour chaque position d'entrée."""
+    if np is not None:
+        return _summarize_numpy(letters, numbers, modulus)
+    return _summarize_loop(letters, numbers, modulus)
+
+
+def summarize_chunk(path: str, start: int, end: int) -> Summary:
+    """Exécuté dans un processus fils : ne lit que sa tranche du fichier."""
+    with mapped(path) as mm:
+        data = mm[start:end]
+    return summarize_rotations(*parse_chunk(data))
+
+
+def stitch(summaries, start: int = 50) -> Tuple[int, int]:
+    """Recolle les résumés dans l'ordre du journal."""
+    position, part1, part2 = start % DIAL, 0, 0
+    for net, zeros1, zeros2 in summaries:
+        part1 += zeros1[position]
+        part2 += zeros2[position]
+        position = (position + net) % DIAL
+    return part1, part2
+
+
+def solve_stream(
+    path,
+    workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    start: int = 50,
+) -> Tuple[int, int]:
+    """(partie 1, partie 2) sur le journal path, en mémoire bornée par morceau."""
+    path = str(path)
+    with mapped(path) as mm:
+        bounds = chunk_bounds(mm, chunk_bytes)
+    if workers == 1 or len(bounds) <= 1:
+        return stitch((summarize_chunk(path, s, e) for s, e in bounds), start)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        starts, ends = zip(*bounds)
+        return stitch(pool.map(summarize_chunk, [path] * len(bounds), starts, ends), start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="day1 en flux : morceaux résumés en parallèle puis recollés.")
+    parser.add_argument("path", nargs="?", default=str(Path(__file__).resolve().parent / "inputs.txt"))
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-mb", type=float, default=DEFAULT_CHUNK_BYTES / (1 << 20))
+    parser.add_argument("--start", type=int, default=50)
+    args = parser.parse_args()
+
+    part1, part2 = solve_stream(args.path, args.workers, int(args.chunk_mb * (1 << 20)), args.start)
+    print(part1)
+    print(part2)
+
+
+if __name__ == "__main__":
+    main()
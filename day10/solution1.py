@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import sys
 from collections import deque
-from typing import List, Tuple
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.instrument import record
 
 
 def parse_machine(line: str) -> Tuple[int, int, List[int]]:
@@ -49,11 +55,15 @@ def parse_machine(line: str) -> Tuple[int, int, List[int]]:
     return n, target_mask, buttons
 
 
-def min_presses(num_lights: int, target: int, buttons: List[int]) -> int:
+def min_presses(num_lights: int, target: int, buttons: List[int], machine: Optional[int] = None) -> int:
     """
     BFS sur les états (bitmask) pour trouver le nombre minimal de pressions.
     Chaque bouton est un toggle (XOR) appliqué au masque courant.
+
+    machine : rang de la machine dans le fichier, repris dans l'enregistrement
+    d'instrumentation pour retrouver la machine coûteuse.
     """
+    stats = record("min_presses", machine=machine, lights=num_lights, buttons=len(buttons))
     if target == 0:
         return 0
 
@@ -65,6 +75,9 @@ def min_presses(num_lights: int, target: int, buttons: List[int]) -> int:
     while queue:
         state = queue.popleft()
         current = dist[state]
+        if stats is not None:
+            stats["nodes"] += 1
+            stats["edges"] += len(buttons)
 
         for button in buttons:
             nxt = state ^ button
@@ -79,21 +92,36 @@ def min_presses(num_lights: int, target: int, buttons: List[int]) -> int:
     return -1  # non atteignable, improbable avec les données fournies
 
 
-def solve(path: str) -> int:
-    total = 0
+Machine = Tuple[int, int, List[int]]
+
+
+def read_machines(path: str) -> List[Machine]:
+    machines: List[Machine] = []
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            num_lights, target, buttons = parse_machine(line)
-            presses = min_presses(num_lights, target, buttons)
-            if presses == -1:
-                raise ValueError(f"Configuration impossible pour la ligne : {line!r}")
-            total += presses
+            machines.append(parse_machine(line))
+    return machines
+
+
+def solve_machines(machines: List[Machine]) -> int:
+    total = 0
+    for i, (num_lights, target, buttons) in enumerate(machines):
+        presses = min_presses(num_lights, target, buttons, machine=i)
+        if presses == -1:
+            raise ValueError(
+                f"Configuration impossible pour la machine : {(num_lights, target, buttons)!r}"
+            )
+        total += presses
     return total
 
 
+def solve(path: str) -> int:
+    return solve_machines(read_machines(path))
+
+
 def main() -> None:
     print(solve("inputs.txt"))
 
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import re
+import sys
 from fractions import Fraction
-from typing import List, Tuple
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.instrument import record
 
 
 def parse_machine(line: str) -> Tuple[List[List[int]], List[int], List[int]]:
@@ -121,11 +127,17 @@ def compute_bounds(
     return [(0, max_press[free_var]) for free_var in free_cols]
 
 
-def min_presses(matrix: List[List[int]], target: List[int], buttons: List[List[int]]) -> int:
+def min_presses(
+    matrix: List[List[int]], target: List[int], buttons: List[List[int]], machine: Optional[int] = None
+) -> int:
     """
     Résout min somme(x_j) avec A x = target, x_j >= 0 (entiers).
     On exploite le fait qu'il y a peu de variables libres (<= 3 d'après les données).
+
+    machine : rang de la machine dans le fichier, repris dans l'enregistrement
+    d'instrumentation pour retrouver la machine coûteuse.
     """
+    stats = record("min_presses", machine=machine, num_counters=len(target), buttons=len(buttons))
     if not matrix:
         return 0
 
@@ -134,6 +146,8 @@ def min_presses(matrix: List[List[int]], target: List[int], buttons: List[List[i
     base, coeff, free_cols = build_solution_family(mat_rref, pivot_cols, num_vars)
 
     f = len(free_cols)
+    if stats is not None:
+        stats["free_vars"] = f
     if f == 0:
         if any(v < 0 for v in base):
             raise ValueError("Solution négative trouvée.")
@@ -162,6 +176,8 @@ def min_presses(matrix: List[List[int]], target: List[int], buttons: List[List[i
 
     def dfs(idx: int, partial_cost: int) -> None:
         nonlocal best
+        if stats is not None:
+            stats["nodes"] += 1
         if idx == f:
             if any(v < 0 for v in current):
                 return
@@ -178,6 +194,8 @@ def min_presses(matrix: List[List[int]], target: List[int], buttons: List[List[i
             if cost_coeff[k2] < 0:
                 optimistic += cost_coeff[k2] * bounds[k2][1]
         if best is not None and optimistic >= best:
+            if stats is not None:
+                stats["prune_bound"] += 1
             return
 
         lb, ub = bounds[idx]
@@ -202,6 +220,8 @@ def min_presses(matrix: List[List[int]], target: List[int], buttons: List[List[i
             if not invalid:
                 new_cost = partial_cost + cost_coeff[idx] * val
                 dfs(idx + 1, new_cost)
+            elif stats is not None:
+                stats["prune_negative"] += 1
 
             # Backtrack
             for var_idx in range(num_vars):
@@ -213,18 +233,31 @@ def min_presses(matrix: List[List[int]], target: List[int], buttons: List[List[i
     return best
 
 
-def solve(path: str) -> int:
-    total = 0
+Machine = Tuple[List[List[int]], List[int], List[List[int]]]
+
+
+def read_machines(path: str) -> List[Machine]:
+    machines: List[Machine] = []
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            matrix, target, buttons = parse_machine(line)
-            total += min_presses(matrix, target, buttons)
+            machines.append(parse_machine(line))
+    return machines
+
+
+def solve_machines(machines: List[Machine]) -> int:
+    total = 0
+    for i, (matrix, target, buttons) in enumerate(machines):
+        total += min_presses(matrix, target, buttons, machine=i)
     return total
 
 
+def solve(path: str) -> int:
+    return solve_machines(read_machines(path))
+
+
 def main() -> None:
     print(solve("inputs.txt"))
 
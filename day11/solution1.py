@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 import sys
 from functools import lru_cache
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.instrument import record
+from tools.parsing import read_adjacency
 
 
 def read_graph(path: str):
@@ -11,21 +17,7 @@ def read_graph(path: str):
     ...
     et renvoie un dict { 'aaa': ['you', 'hhh'], ... }
     """
-    graph = {}
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            # format: "source: dest1 dest2 dest3"
-            left, right = line.split(":")
-            src = left.strip()
-            if right.strip() == "":
-                targets = []
-            else:
-                targets = right.strip().split()
-            graph[src] = targets
-    return graph
+    return read_adjacency(path)
 
 
 def count_paths(graph, start="you", end="out"):
@@ -49,7 +41,13 @@ def count_paths(graph, start="you", end="out"):
             total += dfs(nxt)
         return total
 
-    return dfs(start)
+    result = dfs(start)
+    stats = record("count_paths", start=start, end=end)
+    if stats is not None:
+        info = dfs.cache_info()
+        stats["cache_hits"] += info.hits
+        stats["cache_misses"] += info.misses
+    return result
 
 
 def main():
@@ -1,6 +1,12 @@
 #!/usr/bin/env python3
 import sys
 from functools import lru_cache
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.instrument import record
+from tools.parsing import read_adjacency
 
 
 START_NODE = "svr"
@@ -17,23 +23,7 @@ def read_graph(path: str):
     et renvoie un dict:
       { 'aaa': ['bbb', 'ccc'], 'svr': ['aaa', 'bbb'], ... }
     """
-    graph = {}
-
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            # Couper une seule fois sur ":"
-            parts = line.split(":", 1)
-            if len(parts) != 2:
-                continue  # ligne invalide, on ignore
-            left, right = parts
-            src = left.strip()
-            targets = right.strip().split() if right.strip() else []
-            graph[src] = targets
-
-    return graph
+    return read_adjacency(path)
 
 
 def count_paths(graph):
@@ -76,7 +66,13 @@ def count_paths(graph):
 
         return total_paths, good_paths
 
-    return dfs(START_NODE, 0)
+    result = dfs(START_NODE, 0)
+    stats = record("count_paths", start=START_NODE, end=END_NODE)
+    if stats is not None:
+        info = dfs.cache_info()
+        stats["cache_hits"] += info.hits
+        stats["cache_misses"] += info.misses
+    return result
 
 def main():
     input_path = "inputs.txt"  
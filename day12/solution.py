@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
 from functools import lru_cache
+from pathlib import Path
 from typing import List, Tuple, Set
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.instrument import record
+
 
 # ======================
 # CONFIG (change ici)
@@ -155,6 +161,8 @@ def build_placements(W: int, H: int, shapes: List[List[str]]) -> Tuple[List[List
 
 
 def can_pack_region(W: int, H: int, placements: List[List[int]], counts: List[int], areas: List[int]) -> bool:
+    stats = record("can_pack_region", W=W, H=H, counts=list(counts))
+
     n = len(placements)
     if len(counts) < n:
         counts = counts + [0] * (n - len(counts))
@@ -164,6 +172,8 @@ def can_pack_region(W: int, H: int, placements: List[List[int]], counts: List[in
     board_area = W * H
     needed_area = sum(counts[s] * areas[s] for s in range(n))
     if needed_area > board_area:
+        if stats is not None:
+            stats["rejected_area"] += 1
         return False
 
     for s, c in enumerate(counts):
@@ -174,6 +184,8 @@ def can_pack_region(W: int, H: int, placements: List[List[int]], counts: List[in
 
     @lru_cache(maxsize=None)
     def dfs(occupied: int, remaining: Tuple[int, ...]) -> bool:
+        if stats is not None:
+            stats["nodes"] += 1
         if all(c == 0 for c in remaining):
             return True
 
@@ -187,6 +199,8 @@ def can_pack_region(W: int, H: int, placements: List[List[int]], counts: List[in
                 continue
             opts = [pm for pm in placements[s] if (pm & occupied) == 0]
             if not opts:
+                if stats is not None:
+                    stats["prune_dead_end"] += 1
                 return False
             if len(opts) < best_len:
                 best_len = len(opts)
@@ -207,19 +221,26 @@ def can_pack_region(W: int, H: int, placements: List[List[int]], counts: List[in
 
         return False
 
-    return dfs(0, counts_t)
+    result = dfs(0, counts_t)
+    if stats is not None:
+        info = dfs.cache_info()
+        stats["cache_hits"] += info.hits
+        stats["cache_misses"] += info.misses
+    return result
 
 
-def main():
-    shapes, regions = parse_input(INPUT_PATH)
-
+def count_packable_regions(shapes: List[List[str]], regions: List[Tuple[int, int, List[int]]]) -> int:
     ok = 0
     for (W, H, counts) in regions:
         placements, areas = build_placements(W, H, shapes)
         if can_pack_region(W, H, placements, counts, areas):
             ok += 1
+    return ok
+
 
-    print(ok)
+def main():
+    shapes, regions = parse_input(INPUT_PATH)
+    print(count_packable_regions(shapes, regions))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Index des IDs invalides de day2, pour répondre à beaucoup de plages sur le
+même espace d'IDs : tableau trié de tous les IDs invalides jusqu'à
+max_digits chiffres + sommes préfixes. La somme sur une plage coûte deux
+bisect et une soustraction.
+
+L'index est construit une fois par règle ("twice" pour la partie 1,
+"repeated" pour la partie 2) puis gardé dans son propre dossier du cache
+disque (.aoc_cache/day2_index/<règle>_<chiffres>_<source>.bin). <source>
+est un condensé des fichiers dont dépend la liste des IDs : la solution qui
+fournit le générateur (passée par load_index), ranges.py et ce module.
+Modifier l'un d'eux change le nom du fichier ; l'ancien index de la même
+règle est supprimé à l'écriture du nouveau. Les tableaux y sont écrits
+bruts (int64), relus d'un seul fromfile.
+
+Usage :
+
+    python day2/index.py --digits 12
+    python day2/index.py --clear
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.cache import DEFAULT_CACHE_DIR, file_sha256
+
+INDEX_DIR = DEFAULT_CACHE_DIR / "day2_index"
+# Toujours dans le condensé : le découpage par nombre de chiffres et le format.
+BASE_SOURCES = [Path(__file__).resolve().parent / "ranges.py", Path(__file__).resolve()]
+
+MAGIC = b"AOCI"
+VERSION = 1
+DEFAULT_DIGITS = 12
+
+# magic, version, max_digits, nombre d'IDs
+_HEADER = struct.Struct("<4sIIQ")
+
+
+class InvalidIdIndex:
+    def __init__(self, ids: array, prefix: array, max_digits: int):
+        self.ids = ids          # IDs invalides triés
+        self.prefix = prefix    # prefix[i] = somme des i premiers IDs
+        self.max_digits = max_digits
+
+    @classmethod
+    def build(cls, numbers: Iterable[int], max_digits: int) -> "InvalidIdIndex":
+        ids = array("q", numbers)
+        try:
+            prefix = array("q", accumulate(ids, initial=0))
+        except OverflowError:
+            raise ValueError(f"sommes préfixes hors int64 pour {max_digits} chiffres") from None
+        return cls(ids, prefix, max_digits)
+
+    def range_sum(self, start: int, end: int) -> int:
+        if end >= 10**self.max_digits:
+            raise ValueError(f"plage {start}-{end} au-delà de l'index ({self.max_digits} chiffres)")
+        return self.prefix[bisect_right(self.ids, end)] - self.prefix[bisect_left(self.ids, start)]
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.max_digits, len(self.ids)))
+            self.ids.tofile(f)
+            self.prefix.tofile(f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "InvalidIdIndex":
+        with open(path, "rb") as f:
+            magic, version, max_digits, count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: index illisible")
+            ids, prefix = array("q"), array("q")
+            ids.fromfile(f, count)
+            prefix.fromfile(f, count + 1)
+        return cls(ids, prefix, max_digits)
+
+
+def source_digest(sources: Sequence[Path]) -> str:
+    """Condensé des fichiers sources (plus BASE_SOURCES) dont dépend l'index."""
+    h = hashlib.sha256()
+    for path in [*sources, *BASE_SOURCES]:
+        h.update(file_sha256(path).encode())
+    return h.hexdigest()[:16]
+
+
+def index_path(rule: str, max_digits: int, digest: str, index_dir: Path = INDEX_DIR) -> Path:
+    return Path(index_dir) / f"{rule}_{max_digits}_{digest}.bin"
+
+
+def load_or_build(
+    rule: str,
+    max_digits: int,
+    generate: Callable[[], Iterable[int]],
+    sources: Sequence[Path],
+    index_dir: Path = INDEX_DIR,
+) -> InvalidIdIndex:
+    """
+    Relit l'index depuis le disque, ou le construit avec generate() et l'y
+    écrit. sources : fichiers qui définissent generate (en pratique la
+    solution appelante).
+    """
+    path = index_path(rule, max_digits, source_digest(sources), index_dir)
+    try:
+        return InvalidIdIndex.load(path)
+    except (FileNotFoundError, ValueError, EOFError):
+        pass
+    index = InvalidIdIndex.build(generate(), max_digits)
+    index.save(path)
+    for stale in path.parent.glob(f"{rule}_{max_digits}_*.bin"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    return index
+
+
+def clear(index_dir: Path = INDEX_DIR) -> int:
+    paths = list(Path(index_dir).glob("*.bin")) if Path(index_dir).exists() else []
+    for path in paths:
+        path.unlink(missing_ok=True)
+    return len(paths)
+
+
+def main() -> None:
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import solution1
+    import solution2
+
+    parser = argparse.ArgumentParser(description="Construit les index d'IDs invalides de day2.")
+    parser.add_argument("--digits", type=int, default=DEFAULT_DIGITS)
+    parser.add_argument("--clear", action="store_true", help="supprime les index construits")
+    args = parser.parse_args()
+
+    if args.clear:
+        print(f"{clear()} index supprimés")
+        return
+
+    for rule, module in (("twice", solution1), ("repeated", solution2)):
+        index = module.load_index(args.digits)
+        path = index_path(rule, args.digits, source_digest([Path(module.__file__)]))
+        print(f"{rule}: {len(index.ids)} IDs, {path} ({path.stat().st_size / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Normalisation des plages d'IDs de day2, partagée par les deux parties :
+tri, fusion des plages qui se chevauchent ou se touchent, puis découpage
+aux puissances de dix. Chaque morceau a un nombre de chiffres fixe, ce
+que les moteurs par longueur exploitent directement. Un ID présent dans
+plusieurs plages n'est plus compté qu'une fois.
+"""
+
+from __future__ import annotations
+
+from typing import Iterator, List, Sequence, Tuple
+
+
+def merge_ranges(starts: Sequence[int], ends: Sequence[int]) -> List[Tuple[int, int]]:
+    """Plages [début, fin] triées, disjointes et non contiguës."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(zip(starts, ends)):
+        if start > end:
+            continue
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def split_by_digits(start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+    """[start, end] -> morceaux (début, fin, nombre de chiffres)."""
+    length = len(str(start))
+    while start <= end:
+        limit = min(end, 10**length - 1)
+        yield start, limit, length
+        start, length = limit + 1, length + 1
+
+
+def normalize_ranges(starts: Sequence[int], ends: Sequence[int]) -> List[Tuple[int, int, int]]:
+    return [piece for start, end in merge_ranges(starts, ends) for piece in split_by_digits(start, end)]
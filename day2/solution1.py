@@ -1,37 +1,53 @@
 import argparse
+import sys
+from pathlib import Path
 
-def parse_ranges_from_file(filepath):
-    start_numbers = []
-    end_numbers = []
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        line = f.read().strip()
-
-    # Enlever une éventuelle virgule finale
-    if line.endswith(","):
-        line = line[:-1]
-
-    # Split par les virgules
-    ranges = line.split(",")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-    for r in ranges:
-        # Chaque segment du style "start-end"
-        start, end = r.split("-")
-        start_numbers.append(int(start))
-        end_numbers.append(int(end))
+from tools.parsing import read_range_pairs
+from index import DEFAULT_DIGITS, load_or_build
+from ranges import normalize_ranges, split_by_digits
 
-    return start_numbers, end_numbers
-
-def start_analysing(start_numbers, end_numbers):
-    length = len(start_numbers)
+def parse_ranges_from_file(filepath):
+    # Une seule ligne "a-b,c-d,..." (virgule finale tolérée)
+    return read_range_pairs(filepath)
+
+def start_analysing(start_numbers, end_numbers, engine="arithmetic", index_digits=DEFAULT_DIGITS):
+    # engine : "arithmetic" (formule), "index" (index trié + sommes préfixes,
+    # cf. index.py) ou "loop" (parcours de référence)
+    # Les plages sont d'abord triées, fusionnées et coupées aux puissances
+    # de dix (cf. ranges.py) : chaque morceau a un nombre de chiffres fixe.
+    if engine == "index":
+        index = load_index(index_digits)
+        analyse = lambda start, end, length: index.range_sum(start, end)
+    elif engine == "arithmetic":
+        analyse = sum_doubled
+    else:
+        analyse = lambda start, end, length: analysing(start, end)
 
     count = 0
 
-    for i in range(length):
-        count += analysing(start_numbers[i],end_numbers[i])
+    for start, end, length in normalize_ranges(start_numbers, end_numbers):
+        count += analyse(start, end, length)
 
     return count
 
+def sum_doubled(start, end, length):
+    # Un ID invalide de 2k chiffres s'écrit h*(10^k+1) avec h à k chiffres :
+    # on borne h dans [start, end] puis on somme la série arithmétique.
+    if length % 2:
+        return 0
+    k = length // 2
+    factor = 10**k + 1
+    h_low = max(10**(k-1), -(-start // factor))
+    h_high = min(10**k - 1, end // factor)
+    if h_low > h_high:
+        return 0
+    return factor * (h_low + h_high) * (h_high - h_low + 1) // 2
+
+def load_index(max_digits=DEFAULT_DIGITS):
+    return load_or_build("twice", max_digits, lambda: doubled_numbers(1, 10**max_digits - 1), [Path(__file__)])
+
 def analysing(start, end):
     count = 0
 
@@ -41,6 +57,13 @@ def analysing(start, end):
 
     return count
 
+def doubled_numbers(start, end):
+    # Énumère dans l'ordre les IDs invalides de [start, end]
+    for low, high, length in split_by_digits(start, end):
+        if length % 2 == 0:
+            factor = 10**(length // 2) + 1
+            yield from (h * factor for h in range(-(-low // factor), high // factor + 1))
+
 def get_invalid_number_boolean(number):
     s = str(number)
     # doit être de longueur paire
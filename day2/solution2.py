@@ -1,37 +1,94 @@
 import argparse
+import sys
+from pathlib import Path
 
-def parse_ranges_from_file(filepath):
-    start_numbers = []
-    end_numbers = []
-
-    with open(filepath, "r", encoding="utf-8") as f:
-        line = f.read().strip()
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-    # Enlever une éventuelle virgule finale
-    if line.endswith(","):
-        line = line[:-1]
+from tools.parsing import read_range_pairs
+from index import DEFAULT_DIGITS, load_or_build
+from ranges import normalize_ranges, split_by_digits
 
-    # Split par les virgules
-    ranges = line.split(",")
+def parse_ranges_from_file(filepath):
+    # Une seule ligne "a-b,c-d,..." (virgule finale tolérée)
+    return read_range_pairs(filepath)
+
+def start_analysing(start_numbers, end_numbers, engine="periodic", index_digits=DEFAULT_DIGITS):
+    # engine : "periodic" (formule), "index" (index trié + sommes préfixes,
+    # cf. index.py) ou "loop" (parcours de référence)
+    # Les plages sont d'abord triées, fusionnées et coupées aux puissances
+    # de dix (cf. ranges.py) : chaque morceau a un nombre de chiffres fixe.
+    if engine == "index":
+        index = load_index(index_digits)
+        analyse = lambda start, end, length: index.range_sum(start, end)
+    elif engine == "periodic":
+        analyse = sum_periodic
+    else:
+        analyse = lambda start, end, length: analysing(start, end)
 
-    for r in ranges:
-        # Chaque segment du style "start-end"
-        start, end = r.split("-")
-        start_numbers.append(int(start))
-        end_numbers.append(int(end))
+    count = 0
 
-    return start_numbers, end_numbers
+    for start, end, length in normalize_ranges(start_numbers, end_numbers):
+        count += analyse(start, end, length)
 
-def start_analysing(start_numbers, end_numbers):
-    length = len(start_numbers)
+    return count
 
+def divisors(n):
+    return [d for d in range(1, n+1) if n % d == 0]
+
+def mobius(n):
+    result = 1
+    p = 2
+    while p*p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+def repunit(length, period):
+    # 10^(L-p) + ... + 10^p + 1 : un bloc h de p chiffres répété donne h * repunit
+    return (10**length - 1) // (10**period - 1)
+
+def block_bounds(start, end, length, period):
+    # Bornes du bloc h (p chiffres, sans zéro en tête) tel que h * repunit soit dans [start, end]
+    factor = repunit(length, period)
+    h_low = max(10**(period-1), -(-start // factor))
+    h_high = min(10**period - 1, end // factor)
+    return factor, h_low, h_high
+
+def sum_with_period(start, end, length, period):
+    # Somme des nombres de L chiffres de [start, end] de période p (pas forcément minimale)
+    factor, h_low, h_high = block_bounds(start, end, length, period)
+    if h_low > h_high:
+        return 0
+    return factor * (h_low + h_high) * (h_high - h_low + 1) // 2
+
+def sum_periodic(start, end, length):
+    # Nombres de L chiffres répétant un bloc au moins deux fois = ceux dont la
+    # période minimale q divise L avec q < L. Si S(d) somme les nombres de
+    # période d (minimale ou non), l'inclusion-exclusion de Möbius donne
+    # sum_{q|L, q<L} P(q) = -sum_{d|L, d<L} mu(L/d) * S(d).
     count = 0
-
-    for i in range(length):
-        count += analysing(start_numbers[i],end_numbers[i])
-
+    for period in divisors(length)[:-1]:
+        mu = mobius(length // period)
+        if mu:
+            count -= mu * sum_with_period(start, end, length, period)
     return count
 
+def periodic_numbers(start, end):
+    # Énumère dans l'ordre les IDs invalides de [start, end], longueur par longueur
+    for low, high, length in split_by_digits(start, end):
+        found = set()
+        for period in divisors(length)[:-1]:
+            factor, h_low, h_high = block_bounds(low, high, length, period)
+            found.update(h * factor for h in range(h_low, h_high + 1))
+        yield from sorted(found)
+
+def load_index(max_digits=DEFAULT_DIGITS):
+    return load_or_build("repeated", max_digits, lambda: periodic_numbers(1, 10**max_digits - 1), [Path(__file__)])
+
 def analysing(start, end):
     count = 0
 
@@ -0,0 +1,171 @@
+"""
+Moteurs de day3.
+
+- Moteur NumPy : toutes les banques sont chargées dans une matrice de
+  chiffres (une ligne par banque, complétée par -1), puis traitées en même
+  temps, colonne par colonne, au lieu de caractère par caractère en Python.
+- RangeMax / best_for_all_k : pour une banque, le meilleur nombre pour
+  chaque k d'un coup, grâce à une sparse table (maximum sur intervalle en
+  O(1)) construite une seule fois.
+- stream_total : mode flux sur le fichier projeté en mémoire, ligne par
+  ligne, sans str ni int() par caractère ; mémoire constante.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.parsing import mapped
+
+try:
+    import numpy as np
+except ImportError:  # NumPy reste optionnel : les solutions gardent leur boucle
+    np = None
+
+# Au-delà, les valeurs ne tiennent plus dans un int64.
+MAX_K = 18
+
+
+def digit_matrix(banks: Sequence[str]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """(matrice int8 rows x max_len, -1 hors banque ; longueurs des banques)."""
+    if "".join(banks).encode("ascii").translate(None, b"0123456789"):
+        raise ValueError("La banque ne doit contenir que des chiffres.")
+    lengths = np.fromiter((len(b) for b in banks), dtype=np.int64, count=len(banks))
+    width = int(lengths.max()) if len(banks) else 0
+    # '/' précède '0' dans la table ASCII : le remplissage devient -1.
+    raw = "".join(b.ljust(width, "/") for b in banks).encode("ascii")
+    matrix = np.frombuffer(raw, dtype=np.uint8).reshape(len(banks), width).astype(np.int8) - 48
+    return matrix, lengths
+
+
+def best_pairs(matrix: "np.ndarray") -> "np.ndarray":
+    """Meilleur nombre à deux chiffres (i < j) de chaque ligne : 10*d[i] + max(d[i+1:])."""
+    suffix_max = np.maximum.accumulate(matrix[:, ::-1], axis=1)[:, ::-1].astype(np.int64)
+    first = matrix[:, :-1].astype(np.int64)
+    rest = suffix_max[:, 1:]
+    candidates = np.where((first >= 0) & (rest >= 0), 10 * first + rest, -1)
+    return candidates.max(axis=1)
+
+
+def best_subsequences(matrix: "np.ndarray", lengths: "np.ndarray", k: int) -> "np.ndarray":
+    """
+    Meilleur nombre à k chiffres (ordre conservé) de chaque ligne, par le
+    glouton : le j-ème chiffre est le maximum (le plus à gauche) de la
+    fenêtre [après le précédent, n - k + j], pour toutes les lignes à la fois.
+    """
+    if k > MAX_K:
+        raise ValueError(f"k > {MAX_K} : dépasse un int64")
+    if (lengths < k).any():
+        raise ValueError(f"Une banque contient moins de {k} chiffres.")
+    rows = np.arange(len(matrix))
+    columns = np.arange(matrix.shape[1])
+    low = np.zeros(len(matrix), dtype=np.int64)
+    values = np.zeros(len(matrix), dtype=np.int64)
+    for j in range(k):
+        high = lengths - k + j
+        window = (columns >= low[:, None]) & (columns <= high[:, None])
+        picked = np.where(window, matrix, -1).argmax(axis=1)
+        values = values * 10 + matrix[rows, picked]
+        low = picked + 1
+    return values
+
+
+class RangeMax:
+    """
+    Sparse table sur les chiffres d'une banque : query(lo, hi) renvoie la
+    position du plus grand chiffre de bank[lo:hi+1] (la plus à gauche en cas
+    d'égalité) en O(1), après une construction en O(n log n).
+    """
+
+    def __init__(self, bank: str):
+        self.digits = [ord(c) - 48 for c in bank]
+        n = len(self.digits)
+        self.table: List[List[int]] = [list(range(n))]
+        span = 1
+        while 2 * span <= n:
+            prev = self.table[-1]
+            self.table.append([self._better(prev[i], prev[i + span]) for i in range(n - 2 * span + 1)])
+            span *= 2
+
+    def _better(self, i: int, j: int) -> int:
+        return j if self.digits[j] > self.digits[i] else i
+
+    def query(self, lo: int, hi: int) -> int:
+        level = (hi - lo + 1).bit_length() - 1
+        row = self.table[level]
+        return self._better(row[lo], row[hi - (1 << level) + 1])
+
+
+def best_for_all_k(bank: str, ks: Optional[Iterable[int]] = None) -> Dict[int, int]:
+    """
+    Meilleur nombre à k chiffres (ordre conservé) de bank, pour chaque k de
+    ks (défaut : 1..len(bank)). Même glouton que la solution 2, mais chaque
+    fenêtre est une requête O(1) sur une seule sparse table : O(k) par k.
+    """
+    n = len(bank)
+    ks = range(1, n + 1) if ks is None else ks
+    rmq = RangeMax(bank)
+    best: Dict[int, int] = {}
+    for k in ks:
+        if not 1 <= k <= n:
+            raise ValueError(f"k={k} hors de 1..{n}")
+        value, low = 0, 0
+        for j in range(k):
+            picked = rmq.query(low, n - k + j)
+            value = value * 10 + rmq.digits[picked]
+            low = picked + 1
+        best[k] = value
+    return best
+
+
+# Motifs d'un octet, du plus grand chiffre au plus petit.
+_DIGITS_DESC = [bytes((c,)) for c in b"9876543210"]
+
+
+def best_in_buffer(buf, start: int, end: int, k: int) -> int:
+    """
+    Meilleur nombre à k chiffres de buf[start:end] (bytes ou mmap) : pour
+    chaque chiffre choisi, buf.find (en C) cherche 9, puis 8... dans la
+    fenêtre du glouton ; la première occurrence trouvée est la bonne.
+    La ligne est d'abord vérifiée (un autre octet lève ValueError, comme
+    int() dans la boucle de référence) : seule copie, d'une ligne.
+    """
+    if buf[start:end].translate(None, b"0123456789"):
+        raise ValueError(f"caractère non chiffre entre {start} et {end}")
+    value, low = 0, start
+    for j in range(k):
+        high = end - k + j + 1  # fenêtre [low, high[
+        for digit in _DIGITS_DESC:
+            pos = buf.find(digit, low, high)
+            if pos != -1:
+                break
+        else:
+            raise ValueError(f"caractère non chiffre entre {low} et {high}")
+        value = value * 10 + digit[0] - 48
+        low = pos + 1
+    return value
+
+
+def stream_total(path, k: int) -> int:
+    """Somme des meilleurs nombres à k chiffres de chaque ligne du fichier, en flux."""
+    total = 0
+    with mapped(path) as mm:
+        pos, size = 0, len(mm)
+        while pos < size:
+            newline = mm.find(b"\n", pos)
+            end = size if newline == -1 else newline
+            start = pos
+            while start < end and mm[start] in b" \t\r":
+                start += 1
+            while end > start and mm[end - 1] in b" \t\r":
+                end -= 1
+            if end > start:
+                if end - start < k:
+                    raise ValueError(f"La banque doit contenir au moins {k} chiffres.")
+                total += best_in_buffer(mm, start, end, k)
+            pos = size if newline == -1 else newline + 1
+    return total
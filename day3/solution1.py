@@ -1,19 +1,24 @@
 import argparse
+import sys
+from pathlib import Path
 
-def parse_numbers_from_file(filepath):
-    numbers = []
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+from tools.parsing import read_nonempty_lines
+from banks import stream_total, best_pairs, digit_matrix, np
 
-            numbers.append(line)
+def parse_numbers_from_file(filepath):
+    return read_nonempty_lines(filepath)
 
-    return numbers
+def start_analysing(numbers, engine="auto"):
+    # engine : "numpy" (toutes les banques d'un coup, cf. banks.py),
+    # "loop" (banque par banque) ou "auto" (NumPy s'il est installé)
+    if numbers and (engine == "numpy" or (engine == "auto" and np is not None)):
+        matrix, lengths = digit_matrix(numbers)
+        if (lengths < 2).any():
+            raise ValueError("La banque doit contenir au moins deux chiffres.")
+        return int(best_pairs(matrix).sum())
 
-def start_analysing(numbers):
     length = len(numbers)
 
     count = 0
@@ -49,7 +54,19 @@ def analysing(bank):
 
     return best
 
+def start_analysing_stream(filepath):
+    # Fichier projeté en mémoire, parcouru en octets : mémoire constante
+    return stream_total(filepath, 2)
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stream", action="store_true", help="mode flux (mmap) pour les très gros fichiers")
+    args = parser.parse_args()
+
+    if args.stream:
+        print(start_analysing_stream("inputs.txt"))
+        return
+
     numbers = parse_numbers_from_file("inputs.txt")
 
     print(start_analysing(numbers))
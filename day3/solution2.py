@@ -1,19 +1,22 @@
 import argparse
+import sys
+from pathlib import Path
 
-def parse_numbers_from_file(filepath):
-    numbers = []
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-    with open(filepath, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+from tools.parsing import read_nonempty_lines
+from banks import stream_total, best_subsequences, digit_matrix, np
 
-            numbers.append(line)
+def parse_numbers_from_file(filepath):
+    return read_nonempty_lines(filepath)
 
-    return numbers
+def start_analysing(numbers, engine="auto"):
+    # engine : "numpy" (toutes les banques d'un coup, cf. banks.py),
+    # "loop" (banque par banque) ou "auto" (NumPy s'il est installé)
+    if numbers and (engine == "numpy" or (engine == "auto" and np is not None)):
+        matrix, lengths = digit_matrix(numbers)
+        return int(best_subsequences(matrix, lengths, 12).sum())
 
-def start_analysing(numbers):
     length = len(numbers)
 
     count = 0
@@ -23,16 +26,16 @@ def start_analysing(numbers):
 
     return count
 
-def analysing(bank):
+def analysing(bank, k=12):
     """
     bank : chaîne de chiffres, ex. "987654321111111..."
-    retourne le plus grand nombre possible à 12 chiffres
+    retourne le plus grand nombre possible à k chiffres (12 par défaut)
     formé en gardant l'ordre des chiffres.
+    Pour plusieurs k sur une même banque : banks.best_for_all_k.
     """
-    k = 12
     n = len(bank)
     if n < k:
-        raise ValueError("La banque doit contenir au moins 12 chiffres.")
+        raise ValueError(f"La banque doit contenir au moins {k} chiffres.")
 
     drops = n - k  # nombre de chiffres qu'on a le droit de "supprimer"
     stack = []
@@ -51,7 +54,19 @@ def analysing(bank):
     return int("".join(result_digits))
 
 
+def start_analysing_stream(filepath):
+    # Fichier projeté en mémoire, parcouru en octets : mémoire constante
+    return stream_total(filepath, 12)
+
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stream", action="store_true", help="mode flux (mmap) pour les très gros fichiers")
+    args = parser.parse_args()
+
+    if args.stream:
+        print(start_analysing_stream("inputs.txt"))
+        return
+
     numbers = parse_numbers_from_file("inputs.txt")
 
     print(start_analysing(numbers))
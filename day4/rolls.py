@@ -0,0 +1,142 @@
+"""
+Moteurs de day4.
+
+- NumPy : la grille devient une matrice d'octets, les rouleaux un masque
+  booléen, et le nombre de voisins de chaque case se calcule d'un coup par
+  somme des 8 décalages du masque entouré d'une bordure vide (une
+  convolution 3x3 sans le centre).
+- Bitboards : chaque ligne est un int Python (bit j = rouleau en colonne j).
+  Les 8 voisins sont des décalages de la ligne et de ses voisines, et le
+  compte est tenu sur 4 plans de bits (additionneurs "bit-sliced") : une
+  opération sur un int traite toute la ligne. Sans dépendance.
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy reste optionnel : les solutions gardent leur boucle
+    np = None
+
+ROLL = ord("@")
+MARK = ord("x")
+# Un rouleau est accessible s'il a strictement moins de voisins que ça.
+MAX_NEIGHBOURS = 4
+
+
+def char_matrix(grid_lines: Sequence[str]) -> "np.ndarray":
+    """Lignes -> matrice uint8 rows x cols (lignes courtes complétées par '.')."""
+    cols = max((len(line) for line in grid_lines), default=0)
+    raw = "".join(line.ljust(cols, ".") for line in grid_lines).encode("ascii")
+    return np.frombuffer(raw, dtype=np.uint8).reshape(len(grid_lines), cols)
+
+
+def neighbour_counts(mask: "np.ndarray") -> "np.ndarray":
+    """Nombre de rouleaux parmi les 8 voisins de chaque case (uint8)."""
+    rows, cols = mask.shape
+    padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = mask
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for di in (0, 1, 2):
+        for dj in (0, 1, 2):
+            if di != 1 or dj != 1:
+                counts += padded[di : di + rows, dj : dj + cols]
+    return counts
+
+
+def accessible_mask(mask: "np.ndarray") -> "np.ndarray":
+    return mask & (neighbour_counts(mask) < MAX_NEIGHBOURS)
+
+
+def marked_lines(chars: "np.ndarray", accessible: "np.ndarray") -> List[str]:
+    """Grille d'origine avec un 'x' sur chaque case du masque."""
+    marked = np.where(accessible, np.uint8(MARK), chars)
+    return [row.tobytes().decode("ascii") for row in marked]
+
+
+def find_accessible(grid_lines: Sequence[str]) -> Tuple["np.ndarray", int, List[str]]:
+    """(masque des rouleaux accessibles, leur nombre, grille marquée)."""
+    chars = char_matrix(grid_lines)
+    accessible = accessible_mask(chars == ROLL)
+    return accessible, int(np.count_nonzero(accessible)), marked_lines(chars, accessible)
+
+
+# Table bytes.translate : '@' -> '1', tout le reste -> '0'.
+_TO_BITS = bytes(49 if c == ROLL else 48 for c in range(256))
+
+
+def row_bits(raw: bytes) -> int:
+    """Octets d'une ligne -> int, colonne j = bit j."""
+    return int(raw.translate(_TO_BITS)[::-1] or b"0", 2)
+
+
+def to_bitboard(grid_lines: Sequence[str]) -> List[int]:
+    return [row_bits(line.encode("ascii")) for line in grid_lines]
+
+
+def _add_bits(planes: List[int], bits: int) -> None:
+    # Incrémente de 1 le compteur binaire (plans de bits) de chaque colonne de bits.
+    for k in range(len(planes)):
+        planes[k], bits = planes[k] ^ bits, planes[k] & bits
+        if not bits:
+            return
+
+
+def accessible_rows(board: List[int], cols: int) -> List[int]:
+    """Bitboard des rouleaux ayant moins de MAX_NEIGHBOURS voisins."""
+    full = (1 << cols) - 1
+    result = []
+    for i, row in enumerate(board):
+        above = board[i - 1] if i > 0 else 0
+        below = board[i + 1] if i + 1 < len(board) else 0
+        planes = [0, 0, 0, 0]  # compteur 0..8 sur 4 bits
+        for line in (above, below):
+            _add_bits(planes, line)
+            _add_bits(planes, (line << 1) & full)
+            _add_bits(planes, line >> 1)
+        _add_bits(planes, (row << 1) & full)
+        _add_bits(planes, row >> 1)
+        # MAX_NEIGHBOURS = 4 : compte >= 4 <=> bit 2 ou bit 3 du compteur
+        result.append(row & ~(planes[2] | planes[3]))
+    return result
+
+
+def apply_bitboard(grid_lines: Sequence[str], board: List[int], char: str) -> List[str]:
+    """Remplace par char les cases dont le bit est à 1 dans board."""
+    lines = []
+    for line, bits in zip(grid_lines, board):
+        if not bits:
+            lines.append(line)
+            continue
+        row = list(line)
+        while bits:
+            low = bits & -bits
+            row[low.bit_length() - 1] = char
+            bits ^= low
+        lines.append("".join(row))
+    return lines
+
+
+def find_accessible_bitboard(grid_lines: Sequence[str]) -> Tuple[int, List[str]]:
+    cols = max((len(line) for line in grid_lines), default=0)
+    accessible = accessible_rows(to_bitboard(grid_lines), cols)
+    return sum(bits.bit_count() for bits in accessible), apply_bitboard(grid_lines, accessible, "x")
+
+
+def removal_rounds_bitboard(grid_lines: Sequence[str]) -> Tuple[int, List[str], List[int]]:
+    """Tours de retrait en bloc : tous les rouleaux accessibles d'un tour sont ôtés d'un masque."""
+    cols = max((len(line) for line in grid_lines), default=0)
+    board = to_bitboard(grid_lines)
+    start = list(board)
+    per_round = []
+    while True:
+        accessible = accessible_rows(board, cols)
+        removed = sum(bits.bit_count() for bits in accessible)
+        if not removed:
+            break
+        board = [row & ~bits for row, bits in zip(board, accessible)]
+        per_round.append(removed)
+    gone = [before & ~after for before, after in zip(start, board)]
+    return sum(per_round), apply_bitboard(grid_lines, gone, "."), per_round
@@ -1,4 +1,24 @@
-def find_accessible_rolls(grid_lines):
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.parsing import read_lines
+from rolls import find_accessible, find_accessible_bitboard, np
+
+
+def find_accessible_rolls(grid_lines, engine="auto"):
+    # engine : "numpy" (masque + sommes décalées, cf. rolls.py), "bitboard"
+    # (une ligne = un int), "loop" (8 directions case par case) ou "auto"
+    # (NumPy s'il est installé, bitboards sinon)
+    if engine == "auto":
+        engine = "numpy" if np is not None else "bitboard"
+    if grid_lines and engine == "numpy":
+        _, count, marked = find_accessible(grid_lines)
+        return count, marked
+    if engine == "bitboard":
+        return find_accessible_bitboard(grid_lines)
+
     # Grille d'origine, non modifiée pendant le calcul
     grid = [list(row) for row in grid_lines]
     rows = len(grid)
@@ -38,8 +58,7 @@ def find_accessible_rolls(grid_lines):
 
 
 def read_input_file(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return [line.rstrip("\n") for line in f]
+    return read_lines(path)
 
 
 def main():
@@ -1,9 +1,85 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.instrument import record
+from tools.parsing import read_lines
+from rolls import removal_rounds_bitboard
+
+
 def read_input_file(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return [line.rstrip("\n") for line in f]
+    return read_lines(path)
+
+
+def simulate_removals(grid_lines, engine="worklist", rounds=False):
+    # engine : "worklist" (incrémental), "bitboard" (tours en bloc sur des
+    # lignes-entiers, cf. rolls.py) ou "scan" (rescanne toute la grille
+    # à chaque tour). rounds=True ajoute la liste des retraits par tour.
+    if engine == "worklist":
+        total_removed, final_grid, per_round = simulate_removals_worklist(grid_lines)
+    elif engine == "bitboard":
+        total_removed, final_grid, per_round = removal_rounds_bitboard(grid_lines)
+    else:
+        total_removed, final_grid, per_round = simulate_removals_scan(grid_lines)
+    if rounds:
+        return total_removed, final_grid, per_round
+    return total_removed, final_grid
 
 
-def simulate_removals(grid_lines):
+def simulate_removals_worklist(grid_lines):
+    # Les voisins sont comptés une seule fois ; ensuite seuls les voisins
+    # d'un rouleau retiré peuvent devenir accessibles : ils forment la
+    # liste du tour suivant. Travail total proportionnel au nombre de rouleaux.
+    rows = len(grid_lines)
+    cols = max((len(row) for row in grid_lines), default=0)
+    width = cols + 2  # bordure vide : pas de test de bornes
+    cells = bytearray(b"." * (width * (rows + 2)))
+    for i, row in enumerate(grid_lines):
+        start = (i + 1) * width + 1
+        cells[start:start + len(row)] = row.encode("ascii")
+
+    roll = ord('@')
+    offsets = [-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1]
+    counts = [0] * len(cells)
+    rolls = [p for p in range(len(cells)) if cells[p] == roll]
+    for p in rolls:
+        counts[p] = sum(1 for o in offsets if cells[p + o] == roll)
+
+    stats = record("simulate_removals", rows=rows, cols=cols, engine="worklist")
+    frontier = [p for p in rolls if counts[p] < 4]
+    queued = bytearray(len(cells))
+    for p in frontier:
+        queued[p] = 1
+    per_round = []
+
+    while frontier:
+        if stats is not None:
+            stats["rounds"] += 1
+            stats["cells_scanned"] += len(frontier)
+        for p in frontier:
+            cells[p] = ord('.')  # rouleau retiré
+        per_round.append(len(frontier))
+
+        next_frontier = []
+        for p in frontier:
+            for o in offsets:
+                q = p + o
+                if cells[q] == roll:
+                    counts[q] -= 1
+                    if counts[q] < 4 and not queued[q]:
+                        queued[q] = 1
+                        next_frontier.append(q)
+        frontier = next_frontier
+
+    final_grid = [
+        cells[(i + 1) * width + 1:(i + 1) * width + 1 + len(row)].decode("ascii")
+        for i, row in enumerate(grid_lines)
+    ]
+    return sum(per_round), final_grid, per_round
+
+
+def simulate_removals_scan(grid_lines):
     grid = [list(row) for row in grid_lines]
     rows = len(grid)
     cols = len(grid[0]) if rows > 0 else 0
@@ -15,9 +91,14 @@ def simulate_removals(grid_lines):
     ]
 
     total_removed = 0
+    per_round = []
+    stats = record("simulate_removals", rows=rows, cols=cols, engine="scan")
 
     while True:
         to_remove = []
+        if stats is not None:
+            stats["rounds"] += 1
+            stats["cells_scanned"] += rows * cols
 
         for i in range(rows):
             for j in range(cols):
@@ -43,9 +124,10 @@ def simulate_removals(grid_lines):
             grid[i][j] = '.'  # rouleau retiré
 
         total_removed += len(to_remove)
+        per_round.append(len(to_remove))
 
     final_grid = ["".join(row) for row in grid]
-    return total_removed, final_grid
+    return total_removed, final_grid, per_round
 
 
 def main():
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Mode tuilé de day4 pour les grilles plus grandes que la mémoire.
+
+Le fichier (lignes de largeur fixe) est projeté en mémoire et découpé en
+tuiles ; chaque processus fils ne lit que sa tuile plus un halo d'une case
+et la traite en bitboards (cf. rolls.py). La mémoire résidente reste de
+l'ordre d'une tuile par processus.
+
+Partie 1 : chaque tuile compte ses rouleaux accessibles, on somme.
+
+Partie 2 : l'état courant vit dans une copie de travail du fichier, elle
+aussi projetée. Chaque tuile retire ses rouleaux jusqu'à son point fixe
+local, le halo étant figé à l'état lu, puis écrit ses retraits. Seules les
+tuiles voisines d'un bord modifié sont relancées au tour suivant. Retirer
+un rouleau ne fait que baisser les comptes des autres : l'ordre des
+retraits ne change pas le point fixe final, donc le total est celui de
+la simulation par tours. Le détail par tour, lui, n'est pas disponible
+dans ce mode.
+
+Usage :
+
+    python day4/tiled.py day4/inputs.txt --part 2 --tile 1024 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from rolls import accessible_rows, row_bits
+from tools.parsing import mapped
+
+DEFAULT_TILE = 1024
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Grille de largeur fixe : la case (r, c) est à l'octet r * stride + c."""
+    rows: int
+    cols: int
+    stride: int
+
+
+def detect_layout(mm) -> Layout:
+    first = mm.find(b"\n")
+    if first == -1:
+        return Layout(1 if len(mm) else 0, len(mm), len(mm) + 1)
+    cols = first - 1 if first and mm[first - 1] == ord("\r") else first
+    stride = first + 1
+    rows = -(-len(mm) // stride)
+    # Dernière ligne sans '\n' final, ou ligne vide finale : tolérées.
+    if rows and len(mm) - (rows - 1) * stride < cols:
+        if mm[(rows - 1) * stride:].strip():
+            raise ValueError("grille de largeur non fixe")
+        rows -= 1
+    return Layout(rows, cols, stride)
+
+
+def tiles(layout: Layout, size: int) -> List[Tuple[int, int, int, int]]:
+    """Tuiles (r0, r1, c0, c1), bornes de fin exclues."""
+    return [
+        (r0, min(r0 + size, layout.rows), c0, min(c0 + size, layout.cols))
+        for r0 in range(0, layout.rows, size)
+        for c0 in range(0, layout.cols, size)
+    ]
+
+
+def _read_tile(mm, layout: Layout, tile) -> Tuple[List[int], int]:
+    """
+    Bitboard de la tuile avec son halo : ligne 0 = r0 - 1, bit 0 = colonne
+    c0 - 1 (à 0 hors de la grille). Retourne aussi la largeur (bits).
+    """
+    r0, r1, c0, c1 = tile
+    lo, hi = max(c0 - 1, 0), min(c1 + 1, layout.cols)
+    shift = lo - (c0 - 1)
+    board = []
+    for r in range(r0 - 1, r1 + 1):
+        if 0 <= r < layout.rows:
+            offset = r * layout.stride
+            board.append(row_bits(mm[offset + lo : offset + hi]) << shift)
+        else:
+            board.append(0)
+    return board, (c1 - c0) + 2
+
+
+def _interior_mask(tile) -> int:
+    r0, r1, c0, c1 = tile
+    return ((1 << (c1 - c0)) - 1) << 1
+
+
+def count_tile(path: str, layout: Layout, tile) -> int:
+    """Partie 1, dans un processus fils : rouleaux accessibles de la tuile."""
+    with mapped(path) as mm:
+        board, width = _read_tile(mm, layout, tile)
+    interior = _interior_mask(tile)
+    accessible = accessible_rows(board, width)[1:-1]
+    return sum((bits & interior).bit_count() for bits in accessible)
+
+
+def settle_tile(path: str, layout: Layout, tile) -> Tuple[int, Set[Tuple[int, int]]]:
+    """
+    Partie 2, dans un processus fils : retire les rouleaux de la tuile
+    jusqu'au point fixe local et écrit les retraits dans la copie de travail.
+    Retourne le nombre de retraits et les directions (dr, dc) des tuiles
+    voisines dont le halo a changé.
+    """
+    r0, r1, c0, c1 = tile
+    interior = _interior_mask(tile)
+    with open(path, "r+b") as f, mmap.mmap(f.fileno(), 0) as mm:
+        board, width = _read_tile(mm, layout, tile)
+        start = list(board)
+        while True:
+            accessible = accessible_rows(board, width)
+            removed = [0] + [bits & interior for bits in accessible[1:-1]] + [0]
+            if not any(removed):
+                break
+            board = [row & ~bits for row, bits in zip(board, removed)]
+
+        total, dirty = 0, set()
+        left, right = 1 << 1, 1 << (c1 - c0)
+        for k in range(1, len(board) - 1):
+            gone = start[k] & ~board[k]
+            if not gone:
+                continue
+            total += gone.bit_count()
+            r = r0 + k - 1
+            offset = r * layout.stride + c0 - 1
+            bits = gone
+            while bits:
+                low = bits & -bits
+                mm[offset + low.bit_length() - 1] = ord(".")
+                bits ^= low
+            rows_touched = [0] + ([-1] if r == r0 else []) + ([1] if r == r1 - 1 else [])
+            cols_touched = [0] + ([-1] if gone & left else []) + ([1] if gone & right else [])
+            dirty.update((dr, dc) for dr in rows_touched for dc in cols_touched if dr or dc)
+    return total, dirty
+
+
+def _run(pool, fn, args_list):
+    if pool is None:
+        return [fn(*args) for args in args_list]
+    return list(pool.map(fn, *zip(*args_list)))
+
+
+def solve_tiled(
+    path,
+    part: int = 1,
+    tile_size: int = DEFAULT_TILE,
+    workers: Optional[int] = None,
+    workdir: Optional[Path] = None,
+) -> int:
+    path = str(path)
+    with mapped(path) as mm:
+        layout = detect_layout(mm)
+    all_tiles = tiles(layout, tile_size)
+    if not all_tiles:
+        return 0
+    pool = None if workers == 1 else ProcessPoolExecutor(max_workers=workers)
+    try:
+        if part == 1:
+            return sum(_run(pool, count_tile, [(path, layout, t) for t in all_tiles]))
+
+        with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+            state = os.path.join(tmp, "state.txt")
+            shutil.copyfile(path, state)
+            per_row = -(-layout.cols // tile_size)
+            index = {t: (i // per_row, i % per_row) for i, t in enumerate(all_tiles)}
+            by_pos = {pos: t for t, pos in index.items()}
+            pending, total = all_tiles, 0
+            while pending:
+                results = _run(pool, settle_tile, [(state, layout, t) for t in pending])
+                next_pending = set()
+                for t, (removed, dirty) in zip(pending, results):
+                    total += removed
+                    ti, tj = index[t]
+                    next_pending.update(by_pos[(ti + dr, tj + dc)] for dr, dc in dirty if (ti + dr, tj + dc) in by_pos)
+                pending = sorted(next_pending)
+            return total
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="day4 par tuiles, hors mémoire.")
+    parser.add_argument("path", nargs="?", default=str(Path(__file__).resolve().parent / "inputs.txt"))
+    parser.add_argument("--part", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--tile", type=int, default=DEFAULT_TILE, help="côté d'une tuile (cases)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--workdir", type=Path, help="dossier de la copie de travail (partie 2)")
+    args = parser.parse_args()
+
+    print(solve_tiled(args.path, args.part, args.tile, args.workers, args.workdir))
+
+
+if __name__ == "__main__":
+    main()
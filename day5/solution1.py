@@ -1,7 +1,14 @@
 #!/usr/bin/env python3
 
+import sys
+from array import array
 from bisect import bisect_right
-from typing import List, Tuple
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.sidecar import load_sidecar
 
 
 def parse_input(path: str) -> Tuple[List[Tuple[int, int]], List[int]]:
@@ -24,7 +31,14 @@ def parse_input(path: str) -> Tuple[List[Tuple[int, int]], List[int]]:
     Retourne :
     - ranges: liste de (start, end)
     - ids: liste d'entiers
+
+    Si un sidecar binaire à jour existe (python -m tools.sidecar), il est
+    chargé à la place du texte.
     """
+    arrays = load_sidecar(path, required=("starts", "ends", "ids"))
+    if arrays is not None:
+        return from_sidecar(arrays)
+
     with open(path, "r", encoding="utf-8") as f:
         # strip() enlève espaces, \n, \r...
         lines = [line.strip() for line in f]
@@ -58,6 +72,19 @@ def parse_input(path: str) -> Tuple[List[Tuple[int, int]], List[int]]:
     return ranges, ids
 
 
+def to_sidecar(data: Tuple[List[Tuple[int, int]], List[int]]) -> Dict[str, array]:
+    ranges, ids = data
+    return {
+        "starts": array("q", (s for s, _ in ranges)),
+        "ends": array("q", (e for _, e in ranges)),
+        "ids": array("q", ids),
+    }
+
+
+def from_sidecar(arrays: Dict[str, array]) -> Tuple[List[Tuple[int, int]], List[int]]:
+    return list(zip(arrays["starts"], arrays["ends"])), arrays["ids"].tolist()
+
+
 def merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
     """
     Fusionne les intervalles qui se chevauchent ou se touchent.
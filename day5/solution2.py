@@ -1,14 +1,25 @@
 #!/usr/bin/env python3
 
+import sys
+from pathlib import Path
 from typing import List, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.sidecar import load_sidecar
+
 
 def parse_ranges_only(path: str) -> List[Tuple[int, int]]:
     """
     Lit uniquement la première section du fichier (les ranges),
     jusqu'à la première ligne vide.
     Chaque ligne doit être de la forme 'start-end'.
+    Utilise le sidecar binaire écrit par la partie 1 s'il est à jour.
     """
+    arrays = load_sidecar(path, required=("starts", "ends"))
+    if arrays is not None:
+        return list(zip(arrays["starts"], arrays["ends"]))
+
     ranges: List[Tuple[int, int]] = []
 
     with open(path, "r", encoding="utf-8") as f:
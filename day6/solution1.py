@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
 
+import sys
+from pathlib import Path
 from typing import List, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.parsing import read_lines
+
 
 def read_input_file(path: str) -> List[str]:
     """
     Lit le fichier d'entrée et retourne une liste de lignes
     en conservant les espaces (on enlève seulement le '\n').
     """
-    with open(path, "r", encoding="utf-8") as f:
-        return [line.rstrip("\n") for line in f]
+    return read_lines(path)
 
 
 def split_into_blocks(lines: List[str]) -> List[List[str]]:
@@ -113,27 +118,26 @@ def parse_worksheet(lines: List[str]) -> Tuple[List[int], int]:
     return results, grand_total
 
 
-def main():
-    # Adapte le nom du fichier si besoin
-    lines = read_input_file("inputs.txt")
-
-    # On gère le cas où il y aurait plusieurs grilles dans le même fichier
-    worksheets = split_into_blocks(lines)
-
-    all_results: List[int] = []
+def solve_worksheets(lines: List[str]) -> int:
+    """
+    Somme des grands totaux de toutes les worksheets du fichier
+    (on gère le cas où il y aurait plusieurs grilles dans le même fichier).
+    """
     global_total = 0
 
-    for ws_index, ws_lines in enumerate(worksheets):
-        results, total = parse_worksheet(ws_lines)
-        all_results.extend(results)
+    for ws_lines in split_into_blocks(lines):
+        _, total = parse_worksheet(ws_lines)
         global_total += total
 
-    # Pour AoC généralement on ne veut que le total final :
-    print(global_total)
+    return global_total
+
+
+def main():
+    # Adapte le nom du fichier si besoin
+    lines = read_input_file("inputs.txt")
 
-    # Si tu veux débugguer, tu peux décommenter :
-    # print("Résultats individuels :", all_results)
-    # print("Grand total global :", global_total)
+    # Pour AoC généralement on ne veut que le total final :
+    print(solve_worksheets(lines))
 
 
 if __name__ == "__main__":
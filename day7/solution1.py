@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Iterable, List, Set, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.parsing import read_lines
+
 Grid = List[str]
 
 
 def read_grid(path: str) -> Grid:
-    with open(path, "r", encoding="utf-8") as f:
-        return [line.rstrip("\n") for line in f]
+    return read_lines(path)
 
 
 def find_start(grid: Grid) -> Tuple[int, int]:
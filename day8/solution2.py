@@ -2,25 +2,36 @@
 
 from __future__ import annotations
 
+import sys
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.parsing import read_int_tuples
+from tools.sidecar import load_sidecar
 
 Point = Tuple[int, int, int]
 
 
 def read_points(path: str) -> List[Point]:
-    points: List[Point] = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split(",")
-            if len(parts) != 3:
-                raise ValueError(f"Ligne invalide : {line!r}")
-            x, y, z = map(int, parts)
-            points.append((x, y, z))
-    return points
+    # Sidecar binaire à jour (python -m tools.sidecar) : pas de parsing texte.
+    arrays = load_sidecar(path, required=("points",))
+    if arrays is not None:
+        return from_sidecar(arrays)
+    # Lignes "x,y,z" ; lève ValueError si une ligne n'a pas 3 champs.
+    return read_int_tuples(path, 3)
+
+
+def to_sidecar(points: List[Point]) -> Dict[str, array]:
+    return {"points": array("q", (c for p in points for c in p))}
+
+
+def from_sidecar(arrays: Dict[str, array]) -> List[Point]:
+    flat = arrays["points"].tolist()
+    return list(zip(flat[0::3], flat[1::3], flat[2::3]))
 
 
 def dist2(a: Point, b: Point) -> int:
@@ -72,7 +83,10 @@ class DSU:
 
 
 def solve(path: str) -> int:
-    points = read_points(path)
+    return solve_points(read_points(path))
+
+
+def solve_points(points: List[Point]) -> int:
     if not points:
         return 0
 
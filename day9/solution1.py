@@ -1,19 +1,15 @@
 #!/usr/bin/env python3
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.parsing import read_int_tuples
 
 
 def read_points(path: str):
-    """Lit les points 'x,y' ligne par ligne depuis un fichier."""
-    points = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            # chaque ligne est de la forme "7,1"
-            x_str, y_str = line.split(",")
-            points.append((int(x_str), int(y_str)))
-    return points
+    """Lit les points 'x,y' depuis un fichier."""
+    return read_int_tuples(path, 2)
 
 
 def max_rectangle_area(points):
@@ -1,20 +1,17 @@
 #!/usr/bin/env python3
 import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.parsing import read_int_tuples
 
 # ------------------------------------------------------------
 # Lecture des points rouges
 # ------------------------------------------------------------
 
 def read_red_points(path: str):
-    pts = []
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            x_str, y_str = line.split(",")
-            pts.append((int(x_str), int(y_str)))
-    return pts
+    return read_int_tuples(path, 2)
 
 # ------------------------------------------------------------
 # Construction des arêtes du polygone
@@ -58,114 +55,63 @@ def build_edges(red_points):
     return edges, vertical_edges, horizontal_edges
 
 # ------------------------------------------------------------
-# Test point sur le bord du polygone
+# Grille compressée des tuiles rouges ou vertes
 # ------------------------------------------------------------
 
-def point_on_boundary(x, y, edges):
+def compress(values):
     """
-    Retourne True si (x,y) est exactement sur une arête du polygone
-    (y compris aux sommets).
+    Coupures de l'axe : chaque coordonnée v de sommet donne une bande d'une
+    seule tuile [v, v+1), et l'intervalle entre deux sommets une bande large.
+    Aucune arête ne commence ni ne finit à l'intérieur d'une bande, donc
+    toutes les tuiles d'une bande sont dans le même état.
+    Retourne (coupures, indice de bande de chaque coordonnée de sommet).
     """
-    for (x1, y1, x2, y2) in edges:
-        if x1 == x2:  # vertical
-            if x == x1 and min(y1, y2) <= y <= max(y1, y2):
-                return True
-        elif y1 == y2:  # horizontal
-            if y == y1 and min(x1, x2) <= x <= max(x1, x2):
-                return True
-    return False
+    cuts = sorted({c for v in values for c in (v, v + 1)})
+    return cuts, {c: k for k, c in enumerate(cuts)}
 
-# ------------------------------------------------------------
-# Test point dans polygone (inside ou sur le bord)
-# ------------------------------------------------------------
 
-def build_point_in_polygon_fn(edges, vertical_edges):
+def build_bad_prefix(vertical_edges, horizontal_edges, xs, ys, x_index):
     """
-    Construit une fonction is_inside(x, y) qui teste si (x,y) est dans
-    le polygone ou sur son bord.
-
-    On sépare:
-      - test "sur le bord" (vertical + horizontal),
-      - test "inside" par ray casting utilisant seulement les arêtes verticales.
+    Sommes préfixes 2D du nombre de bandes "hors polygone" : bad[j][i]
+    compte les bandes (colonne < i, ligne < j) dont les tuiles ne sont ni
+    sur le bord ni à l'intérieur. La dernière coupure (max + 1) est hors
+    de tout rectangle et n'ouvre pas de bande.
     """
+    cols, rows = len(xs) - 1, len(ys) - 1
+    horizontal_by_y = {}
+    for hx1, hx2, hy in horizontal_edges:
+        horizontal_by_y.setdefault(hy, []).append((hx1, hx2))
 
-    def is_inside(x, y, cache):
-        # cache est un dict {(x,y): bool}
-        key = (x, y)
-        if key in cache:
-            return cache[key]
-
-        # 1) Sur le bord ?
-        if point_on_boundary(x, y, edges):
-            cache[key] = True
-            return True
+    bad = [[0] * (cols + 1)]
+    for j in range(rows):
+        y = ys[j]
+        good = [False] * cols
 
-        # 2) Ray casting vers +infini en x, en utilisant les arêtes verticales
-        crossings = 0
+        # Bord : arêtes verticales qui passent par cette ligne, arêtes horizontales dessus.
         for vx, vy1, vy2 in vertical_edges:
-            if vy1 <= y < vy2 and vx > x:
-                crossings += 1
-
-        inside = (crossings % 2 == 1)
-        cache[key] = inside
-        return inside
-
-    return is_inside
-
-# ------------------------------------------------------------
-# Test si le rectangle croise le bord du polygone (vraie intersection)
-# ------------------------------------------------------------
-
-def build_rect_crosses_polygon_fn(vertical_edges, horizontal_edges):
-    """
-    Construit une fonction rect_crosses_polygon(left, right, top, bottom)
-    qui teste si le rectangle [left,right] x [top,bottom] (bords compris)
-    a un bord qui coupe le bord du polygone en un point strictement intérieur
-    aux deux segments (les coïncidences sur les coins / le bord sont autorisées).
-    """
-
-    def rect_crosses_polygon(left, right, top, bottom):
-        # On considère uniquement les croisements "vrai" entre
-        # un segment vertical et un segment horizontal.
-        # Les segments colinéaires ne sont pas traités comme des croisements
-        # (on autorise le rectangle à être collé au bord).
-
-        # 1) Croisements potentiels : arêtes verticales du polygone
-        #    avec les bords horizontaux du rectangle (top et bottom).
-        if top != bottom:
-            for vx, vy1, vy2 in vertical_edges:
-                if left < vx < right:
-                    if vy1 < top < vy2:
-                        return True
-                    if vy1 < bottom < vy2:
-                        return True
-        else:
-            # Rectangle de hauteur 1 (top == bottom): seul bord horizontal,
-            # on teste aussi, même logique (croisement au milieu).
-            y = top
-            for vx, vy1, vy2 in vertical_edges:
-                if left < vx < right and vy1 < y < vy2:
-                    return True
-
-        # 2) Croisements potentiels : arêtes horizontales du polygone
-        #    avec les bords verticaux du rectangle (left et right).
-        if left != right:
-            for hx1, hx2, hy in horizontal_edges:
-                if top < hy < bottom:
-                    if hx1 < left < hx2:
-                        return True
-                    if hx1 < right < hx2:
-                        return True
-        else:
-            # Rectangle de largeur 1 (left == right)
-            x = left
-            for hx1, hx2, hy in horizontal_edges:
-                if top < hy < bottom and hx1 < x < hx2:
-                    return True
-
-        return False
-
-    return rect_crosses_polygon
+            if vy1 <= y <= vy2:
+                good[x_index[vx]] = True
+        for hx1, hx2 in horizontal_by_y.get(y, ()):
+            for i in range(x_index[hx1], x_index[hx2] + 1):
+                good[i] = True
+
+        # Intérieur : parité des arêtes verticales croisées vers +infini en x.
+        crossings = sorted(vx for vx, vy1, vy2 in vertical_edges if vy1 <= y < vy2)
+        k = 0
+        for i in range(cols):
+            while k < len(crossings) and crossings[k] <= xs[i]:
+                k += 1
+            if (len(crossings) - k) % 2 == 1:
+                good[i] = True
+
+        previous = bad[-1]
+        row = [0] * (cols + 1)
+        run = 0
+        for i in range(cols):
+            run += not good[i]
+            row[i + 1] = previous[i + 1] + run
+        bad.append(row)
+    return bad
 
 # ------------------------------------------------------------
 # Calcul du plus grand rectangle
@@ -184,12 +130,10 @@ def max_rectangle_area_red_green(red_points):
     if n == 0:
         return 0, None
 
-    edges, vertical_edges, horizontal_edges = build_edges(red_points)
-    is_inside = build_point_in_polygon_fn(edges, vertical_edges)
-    rect_crosses_polygon = build_rect_crosses_polygon_fn(vertical_edges, horizontal_edges)
-
-    # Cache pour les tests point-in-polygon des coins C et D
-    pip_cache = {}
+    _, vertical_edges, horizontal_edges = build_edges(red_points)
+    xs, x_index = compress(x for x, _ in red_points)
+    ys, y_index = compress(y for _, y in red_points)
+    bad = build_bad_prefix(vertical_edges, horizontal_edges, xs, ys, x_index)
 
     max_area = 0
     best_pair = None
@@ -210,26 +154,11 @@ def max_rectangle_area_red_green(red_points):
             if area <= max_area:
                 continue
 
-            # Coins du rectangle
-            # A = (x1, y1) rouge
-            # B = (x2, y2) rouge
-            C = (x1, y2)
-            D = (x2, y1)
-
-            # C et D doivent être dans le polygone (ou sur le bord).
-            if not is_inside(C[0], C[1], pip_cache):
-                continue
-            if not is_inside(D[0], D[1], pip_cache):
-                continue
-
-            # Bornes du rectangle (coordonnées originales)
-            left = min(x1, x2)
-            right = max(x1, x2)
-            top = min(y1, y2)
-            bottom = max(y1, y2)
-
-            # Vérifier qu'aucun bord du rectangle ne coupe le bord du polygone
-            if rect_crosses_polygon(left, right, top, bottom):
+            # Bandes couvertes par le rectangle (bornes comprises) : aucune
+            # ne doit être hors du polygone.
+            i1, i2 = sorted((x_index[x1], x_index[x2]))
+            j1, j2 = sorted((y_index[y1], y_index[y2]))
+            if bad[j2 + 1][i2 + 1] - bad[j1][i2 + 1] - bad[j2 + 1][i1] + bad[j1][i1]:
                 continue
 
             # Rectangle valide
@@ -0,0 +1,6 @@
+"""
+Outils communs aux solutions dayN : découverte des solveurs, benchmark, etc.
+
+Les scripts dayN/solution*.py restent autonomes ; ce paquet ne fait que
+les importer depuis la racine du dépôt.
+"""
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Benchmark de toutes les solutions dayN, phase par phase (parse puis solve).
+
+Usage (depuis la racine du dépôt) :
+
+    python -m tools.bench
+    python -m tools.bench --days 1 2 8 --repeat 10 --json bench.json
+    python -m tools.bench --days 8 12 --memory-profile --memory-budget 512M
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import json
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tools.solvers import SolverSpec, discover, load_module, run_parse, run_solve
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Percentile par rang le plus proche (pas d'interpolation)."""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil
+    return ordered[int(rank) - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 95),
+        "runs": len(samples),
+    }
+
+
+@contextlib.contextmanager
+def quiet():
+    """Les solutions impriment parfois beaucoup : on coupe stdout pendant la mesure."""
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            yield
+
+
+def time_phase(
+    fn: Callable[[], Any],
+    repeat: int,
+    warmup: int,
+    prepare: Optional[Callable[[], None]] = None,
+) -> Tuple[List[float], Any]:
+    """
+    Exécute fn warmup + repeat fois et retourne les durées (en secondes)
+    des repeat dernières exécutions, ainsi que le dernier résultat.
+    prepare est appelé avant chaque exécution, hors chronométrage.
+    """
+    samples: List[float] = []
+    result = None
+    for i in range(warmup + repeat):
+        if prepare is not None:
+            prepare()
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples, result
+
+
+def measure_peak(fn: Callable[[], Any]) -> int:
+    """Pic mémoire (octets alloués côté Python) pendant une exécution de fn."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench_solver(
+    spec: SolverSpec,
+    input_name: str,
+    repeat: int,
+    warmup: int,
+    memory: bool = True,
+) -> Dict[str, Any]:
+    input_path = spec.path.parent / input_name
+    module = load_module(spec)
+
+    parsed: Dict[str, Any] = {}
+
+    def parse():
+        return run_parse(spec, module, input_path)
+
+    # Certaines fonctions modifient leur entrée (tri en place, pop...) :
+    # chaque solve reçoit une copie fraîche, faite hors chronométrage.
+    def prepare():
+        parsed["copy"] = copy.deepcopy(parsed["data"])
+
+    def solve():
+        return run_solve(spec, module, parsed["copy"])
+
+    with quiet():
+        parse_samples, data = time_phase(parse, repeat, warmup)
+        parsed["data"] = data
+        solve_samples, answer = time_phase(solve, repeat, warmup, prepare)
+
+        parse_stats = summarize(parse_samples)
+        solve_stats = summarize(solve_samples)
+        if memory:
+            parse_stats["peak_bytes"] = measure_peak(parse)
+            prepare()
+            solve_stats["peak_bytes"] = measure_peak(solve)
+
+    return {
+        "solver": spec.name,
+        "input": str(input_path.relative_to(spec.path.parent.parent)),
+        "answer": answer,
+        "parse": parse_stats,
+        "solve": solve_stats,
+    }
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    header = f"{'solver':<16} {'phase':<6} {'min ms':>10} {'median ms':>10} {'p95 ms':>10} {'peak KiB':>10}  answer"
+    lines = [header, "-" * len(header)]
+    for res in results:
+        for phase in ("parse", "solve"):
+            st = res[phase]
+            peak = st.get("peak_bytes")
+            peak_str = f"{peak / 1024:.1f}" if peak is not None else "-"
+            answer = res["answer"] if phase == "solve" else ""
+            lines.append(
+                f"{res['solver']:<16} {phase:<6} "
+                f"{st['min'] * 1e3:>10.3f} {st['median'] * 1e3:>10.3f} {st['p95'] * 1e3:>10.3f} "
+                f"{peak_str:>10}  {answer}"
+            )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Benchmark des solutions dayN (parse / solve).")
+    parser.add_argument("--days", type=int, nargs="*", help="jours à mesurer (défaut : tous)")
+    parser.add_argument("--input", default="inputs.txt", help="nom du fichier d'entrée dans chaque dossier dayN")
+    parser.add_argument("--repeat", type=int, default=5, help="nombre d'exécutions mesurées")
+    parser.add_argument("--warmup", type=int, default=1, help="nombre d'exécutions de chauffe")
+    parser.add_argument("--no-memory", action="store_true", help="ne pas mesurer le pic mémoire")
+    parser.add_argument("--json", type=Path, help="écrit aussi les résultats en JSON dans ce fichier")
+    parser.add_argument("--memory-profile", action="store_true",
+                        help="au lieu de chronométrer : pic, sites d'allocation et objets par phase (tracemalloc)")
+    parser.add_argument("--memory-budget", help="avec --memory-profile : abandonne une phase au-delà (ex. 512M, 2G)")
+    parser.add_argument("--top", type=int, default=5, help="avec --memory-profile : nombre de sites / types affichés")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    if args.memory_profile:
+        from tools.memprof import format_profiles, parse_size, profile_solver
+
+        budget = parse_size(args.memory_budget) if args.memory_budget else None
+        reports = [
+            profile_solver(spec, spec.path.parent / args.input, args.top, budget)
+            for spec in discover(args.days)
+            if (spec.path.parent / args.input).exists()
+        ]
+        print(format_profiles(reports))
+        if args.json:
+            args.json.write_text(json.dumps({"budget": budget, "results": reports}, indent=2), encoding="utf-8")
+        return
+
+    results: List[Dict[str, Any]] = []
+    for spec in discover(args.days):
+        if not (spec.path.parent / args.input).exists():
+            print(f"{spec.name}: pas de fichier {args.input}, ignoré")
+            continue
+        results.append(bench_solver(spec, args.input, args.repeat, args.warmup, not args.no_memory))
+
+    print(format_table(results))
+
+    if args.json:
+        payload = {"repeat": args.repeat, "warmup": args.warmup, "results": results}
+        args.json.write_text(json.dumps(payload, indent=2, default=str), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
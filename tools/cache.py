@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Cache disque des réponses, adressé par contenu.
+
+Clé = SHA-256 de (contenu du fichier d'entrée, sources du solveur, paramètres).
+Toute modification du code ou de l'entrée change donc la clé : pas besoin
+d'invalidation manuelle. Une entrée = un petit fichier JSON ; la date de
+modification sert d'horodatage LRU et les plus anciennes sont évincées au-delà
+de max_entries.
+
+Usage :
+
+    python -m tools.cache --stats
+    python -m tools.cache --clear
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from tools.solvers import REPO_ROOT, SolverSpec
+
+DEFAULT_CACHE_DIR = REPO_ROOT / ".aoc_cache"
+DEFAULT_MAX_ENTRIES = 512
+
+_MISS = object()
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def tools_imports(path: Path) -> Set[Path]:
+    """
+    Modules tools/*.py importés au niveau module par le fichier path. Les
+    imports locaux aux fonctions (outils de main(), etc.) ne comptent pas.
+    """
+    found: Set[Path] = set()
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names = [node.module] + [f"{node.module}.{a.name}" for a in node.names]
+        elif isinstance(node, ast.Import):
+            names = [a.name for a in node.names]
+        else:
+            continue
+        for name in names:
+            parts = name.split(".")
+            if len(parts) == 2 and parts[0] == "tools":
+                module = REPO_ROOT / "tools" / f"{parts[1]}.py"
+                if module.exists():
+                    found.add(module)
+    return found
+
+
+def solver_sources(spec: SolverSpec) -> List[Path]:
+    """
+    Fichiers dont dépend la réponse : la solution elle-même, les modules
+    voisins du dossier du jour (les autres solution*.py sont exclus) et
+    les modules de tools/ qu'ils importent, de proche en proche.
+    """
+    day_dir = spec.path.parent
+    helpers = sorted(
+        p for p in day_dir.glob("*.py")
+        if p != spec.path and not p.name.startswith("solution")
+    )
+    shared: Set[Path] = set()
+    todo = [spec.path] + helpers
+    while todo:
+        for module in tools_imports(todo.pop()) - shared:
+            shared.add(module)
+            todo.append(module)
+    return [spec.path] + helpers + sorted(shared)
+
+
+def cache_key(spec: SolverSpec, input_path: Path, params: Optional[Dict[str, Any]] = None) -> str:
+    h = hashlib.sha256()
+    h.update(b"input:" + file_sha256(input_path).encode())
+    for src in solver_sources(spec):
+        h.update(f"source:{src.relative_to(REPO_ROOT).as_posix()}:".encode() + file_sha256(src).encode())
+    h.update(f"entry:{spec.parse}:{spec.solve}:{spec.pick}".encode())
+    h.update(b"params:" + json.dumps(params or {}, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def _encode(value: Any) -> Any:
+    # JSON ne distingue pas tuple et liste : on marque les tuples. Les
+    # fractions (day10) sont gardées exactes sous forme [num, den].
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(v) for v in value]}
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+    if isinstance(value, Fraction):
+        return {"__fraction__": [value.numerator, value.denominator]}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"réponse non sérialisable : {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict) and "__tuple__" in value:
+        return tuple(_decode(v) for v in value["__tuple__"])
+    if isinstance(value, dict) and "__fraction__" in value:
+        return Fraction(*value["__fraction__"])
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+class AnswerCache:
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.root = Path(root)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return default
+        os.utime(path)  # rafraîchit la position LRU
+        self.hits += 1
+        return _decode(payload["answer"])
+
+    def put(self, key: str, answer: Any, meta: Optional[Dict[str, Any]] = None) -> None:
+        """Lève TypeError si la réponse n'est pas représentable (rien n'est écrit)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = {"answer": _encode(answer), "meta": meta or {}}
+        tmp = self._path(key).with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, self._path(key))  # écriture atomique
+        self.evict()
+
+    def entries(self) -> List[Tuple[float, Path]]:
+        if not self.root.exists():
+            return []
+        return sorted((p.stat().st_mtime, p) for p in self.root.glob("*.json"))
+
+    def evict(self) -> int:
+        """Supprime les entrées les moins récemment utilisées au-delà de max_entries."""
+        entries = self.entries()
+        excess = len(entries) - self.max_entries
+        for _, path in entries[:max(0, excess)]:
+            path.unlink(missing_ok=True)
+        return max(0, excess)
+
+    def clear(self) -> int:
+        entries = self.entries()
+        for _, path in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
+
+    def lookup(self, spec: SolverSpec, input_path: Path, params: Optional[Dict[str, Any]] = None) -> Tuple[str, Any]:
+        """Retourne (clé, réponse) ; la réponse vaut MISS si absente."""
+        key = cache_key(spec, input_path, params)
+        return key, self.get(key, _MISS)
+
+    @staticmethod
+    def is_miss(value: Any) -> bool:
+        return value is _MISS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gestion du cache de réponses.")
+    parser.add_argument("--dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--clear", action="store_true", help="vide le cache")
+    parser.add_argument("--stats", action="store_true", help="affiche le nombre d'entrées et la taille")
+    args = parser.parse_args()
+
+    cache = AnswerCache(args.dir)
+    if args.clear:
+        print(f"{cache.clear()} entrées supprimées")
+    if args.stats or not args.clear:
+        entries = cache.entries()
+        size = sum(p.stat().st_size for _, p in entries)
+        print(f"{len(entries)} entrées, {size / 1024:.1f} KiB dans {cache.root}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Générateurs d'entrées synthétiques, au format de chaque jour, de taille arbitraire.
+
+Chaque générateur prend un random.Random et une taille (le "bouton" principal :
+nombre de lignes, de points, de régions...) et retourne le texte du fichier.
+Même graine + même taille => même fichier.
+
+Usage :
+
+    python -m tools.generators 8 --size 20000 --seed 1 -o /tmp/day8.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def gen_rotations(rng: random.Random, size: int, max_step: int = 999) -> str:
+    """Jour 1 : une rotation par ligne, ex. 'L68', 'R148'."""
+    lines = [f"{rng.choice('LR')}{rng.randint(1, max_step)}" for _ in range(size)]
+    return "\n".join(lines) + "\n"
+
+
+def gen_id_ranges(rng: random.Random, size: int, width: int = 1000, max_digits: int = 10) -> str:
+    """Jour 2 : 'a-b,c-d,...' sur une seule ligne, size intervalles de largeur <= width."""
+    ranges: List[str] = []
+    for _ in range(size):
+        digits = rng.randint(1, max_digits)
+        start = rng.randint(10 ** (digits - 1), 10 ** digits - 1)
+        end = start + rng.randint(0, width - 1)
+        ranges.append(f"{start}-{end}")
+    return ",".join(ranges) + "\n"
+
+
+def gen_banks(rng: random.Random, size: int, width: int = 100) -> str:
+    """Jour 3 : size banques de width chiffres (1-9)."""
+    lines = ["".join(rng.choice("123456789") for _ in range(width)) for _ in range(size)]
+    return "\n".join(lines) + "\n"
+
+
+def gen_roll_grid(rng: random.Random, size: int, width: Optional[int] = None, density: float = 0.6) -> str:
+    """Jour 4 : grille size x width de '@' (rouleaux) et '.'."""
+    width = width or size
+    lines = [
+        "".join("@" if rng.random() < density else "." for _ in range(width))
+        for _ in range(size)
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def gen_fresh_ranges(rng: random.Random, size: int, max_id: int = 10 ** 12, width: int = 10 ** 9) -> str:
+    """Jour 5 : size intervalles 'a-b', une ligne vide, puis size IDs."""
+    lines: List[str] = []
+    for _ in range(size):
+        start = rng.randint(1, max_id)
+        lines.append(f"{start}-{start + rng.randint(0, width)}")
+    lines.append("")
+    for _ in range(size):
+        lines.append(str(rng.randint(1, max_id)))
+    return "\n".join(lines) + "\n"
+
+
+def gen_worksheet(rng: random.Random, size: int, rows: int = 4, max_digits: int = 4) -> str:
+    """
+    Jour 6 : une worksheet de size problèmes côte à côte.
+    Chaque problème a rows nombres alignés à gauche ou à droite dans son bloc,
+    l'opérateur sur la dernière ligne ; les blocs sont séparés par une colonne vide.
+    """
+    grid: List[List[str]] = [[] for _ in range(rows + 1)]
+    for p in range(size):
+        nums = [str(rng.randint(1, 10 ** rng.randint(1, max_digits) - 1)) for _ in range(rows)]
+        w = max(len(n) for n in nums)
+        left = rng.random() < 0.5
+        for r, n in enumerate(nums):
+            grid[r].append(n.ljust(w) if left else n.rjust(w))
+        grid[rows].append(rng.choice("+*").ljust(w))
+    return "\n".join(" ".join(row) for row in grid) + "\n"
+
+
+def gen_splitter_grid(rng: random.Random, size: int, width: Optional[int] = None, density: float = 0.3) -> str:
+    """Jour 7 : S sur la première ligne, splitters '^' une ligne sur deux."""
+    width = width or max(3, size)
+    lines = ["." * width]
+    start = width // 2
+    lines[0] = lines[0][:start] + "S" + lines[0][start + 1 :]
+    for r in range(1, size):
+        if r % 2 == 0:
+            lines.append("".join("^" if rng.random() < density else "." for _ in range(width)))
+        else:
+            lines.append("." * width)
+    return "\n".join(lines) + "\n"
+
+
+def gen_points_3d(rng: random.Random, size: int, max_coord: int = 100_000) -> str:
+    """Jour 8 : size points 'x,y,z' distincts."""
+    seen = set()
+    lines: List[str] = []
+    while len(lines) < size:
+        p = (rng.randint(0, max_coord), rng.randint(0, max_coord), rng.randint(0, max_coord))
+        if p in seen:
+            continue
+        seen.add(p)
+        lines.append("%d,%d,%d" % p)
+    return "\n".join(lines) + "\n"
+
+
+def gen_rectilinear_polygon(rng: random.Random, size: int, max_coord: int = 100_000) -> str:
+    """
+    Jour 9 : sommets 'x,y' d'un polygone rectiligne simple, dans l'ordre.
+    Profil en "histogramme" : on monte, on avance en x, on change de hauteur...
+    puis on redescend à y=0 et on revient au départ. Environ size sommets.
+    """
+    columns = max(1, (size - 2) // 2)
+    xs = sorted(rng.sample(range(1, max_coord), columns + 1))
+    heights: List[int] = []
+    for _ in range(columns):
+        h = rng.randint(1, max_coord)
+        while heights and h == heights[-1]:
+            h = rng.randint(1, max_coord)
+        heights.append(h)
+
+    pts: List[Tuple[int, int]] = [(xs[0], 0)]
+    for i, h in enumerate(heights):
+        pts.append((xs[i], h))
+        pts.append((xs[i + 1], h))
+    pts.append((xs[-1], 0))
+    return "\n".join(f"{x},{y}" for x, y in pts) + "\n"
+
+
+def gen_machines(rng: random.Random, size: int, max_lights: int = 10, max_press: int = 20) -> str:
+    """
+    Jour 10 : size machines '[.##.] (3) (1,3) ... {3,5,4,7}'.
+    L'indicateur et les exigences sont construits à partir de pressions
+    tirées au hasard : les deux parties ont donc toujours une solution.
+    """
+    lines: List[str] = []
+    for _ in range(size):
+        n = rng.randint(3, max_lights)
+        m = rng.randint(max(1, n - 2), n + 2)
+        buttons = [sorted(rng.sample(range(n), rng.randint(1, n))) for _ in range(m)]
+
+        parity = [0] * n
+        counters = [0] * n
+        for idxs in buttons:
+            toggled = rng.random() < 0.5
+            presses = rng.randint(0, max_press)
+            for i in idxs:
+                parity[i] ^= int(toggled)
+                counters[i] += presses
+
+        indicator = "".join("#" if p else "." for p in parity)
+        btn_str = " ".join("(" + ",".join(map(str, idxs)) + ")" for idxs in buttons)
+        lines.append(f"[{indicator}] {btn_str} {{{','.join(map(str, counters))}}}")
+    return "\n".join(lines) + "\n"
+
+
+def gen_dag(rng: random.Random, size: int, max_out: int = 4) -> str:
+    """
+    Jour 11 : DAG 'src: dst1 dst2 ...' de size noeuds.
+    Les noeuds spéciaux (svr, you, dac, fft, out) sont placés dans l'ordre
+    topologique pour que les deux parties aient des chemins à compter.
+    """
+    size = max(size, 6)
+    name_len = 3
+    while 26 ** name_len < 2 * size:
+        name_len += 1
+
+    special = {"svr", "you", "dac", "fft", "out"}
+    names: List[str] = []
+    seen = set(special)
+    while len(names) < size - len(special):
+        name = "".join(rng.choice(string.ascii_lowercase) for _ in range(name_len))
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+
+    names.insert(0, "svr")
+    names.insert(1, "you")
+    names.insert(len(names) // 3, "dac")
+    names.insert(2 * len(names) // 3, "fft")
+    names.append("out")
+
+    lines: List[str] = []
+    for i, src in enumerate(names[:-1]):
+        # Au moins une arête vers le suivant pour garder le graphe connexe.
+        targets = {names[i + 1]}
+        for _ in range(rng.randint(0, max_out - 1)):
+            targets.add(names[rng.randint(i + 1, min(len(names) - 1, i + 1 + max_out * 4))])
+        lines.append(f"{src}: {' '.join(sorted(targets))}")
+    return "\n".join(lines) + "\n"
+
+
+def gen_shapes_regions(
+    rng: random.Random,
+    size: int,
+    num_shapes: int = 6,
+    min_dim: int = 4,
+    max_dim: int = 12,
+) -> str:
+    """
+    Jour 12 : num_shapes formes 3x3, puis size régions 'WxH: c0 c1 ...'.
+    Les quantités visent une aire totale proche de celle de la région,
+    pour avoir un mélange de régions faisables et infaisables.
+    """
+    out: List[str] = []
+    areas: List[int] = []
+    for s in range(num_shapes):
+        cells = [(x, y) for y in range(3) for x in range(3)]
+        keep = set(rng.sample(cells, rng.randint(5, 7)))
+        out.append(f"{s}:")
+        for y in range(3):
+            out.append("".join("#" if (x, y) in keep else "." for x in range(3)))
+        out.append("")
+        areas.append(len(keep))
+
+    for _ in range(size):
+        w, h = rng.randint(min_dim, max_dim), rng.randint(min_dim, max_dim)
+        budget = int(w * h * rng.uniform(0.5, 1.05))
+        counts = [0] * num_shapes
+        while True:
+            s = rng.randrange(num_shapes)
+            if areas[s] > budget:
+                break
+            counts[s] += 1
+            budget -= areas[s]
+        out.append(f"{w}x{h}: {' '.join(map(str, counts))}")
+    return "\n".join(out) + "\n"
+
+
+GENERATORS: Dict[int, Callable[..., str]] = {
+    1: gen_rotations,
+    2: gen_id_ranges,
+    3: gen_banks,
+    4: gen_roll_grid,
+    5: gen_fresh_ranges,
+    6: gen_worksheet,
+    7: gen_splitter_grid,
+    8: gen_points_3d,
+    9: gen_rectilinear_polygon,
+    10: gen_machines,
+    11: gen_dag,
+    12: gen_shapes_regions,
+}
+
+
+def generate(day: int, size: int, seed: int = 0, **params) -> str:
+    if day not in GENERATORS:
+        raise KeyError(f"Pas de générateur pour le jour {day}")
+    return GENERATORS[day](random.Random(seed), size, **params)
+
+
+def write_input(day: int, size: int, path: Path, seed: int = 0, **params) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate(day, size, seed, **params), encoding="utf-8")
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Génère une entrée synthétique pour un jour donné.")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("--size", type=int, default=1000, help="taille (lignes, points, régions...)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", type=Path, help="fichier de sortie (défaut : stdout)")
+    args = parser.parse_args()
+
+    if args.output:
+        write_input(args.day, args.size, args.output, args.seed)
+    else:
+        print(generate(args.day, args.size, args.seed), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Compteurs d'instrumentation pour les solveurs à base de recherche
+(noeuds explorés, élagages, hits/misses des lru_cache, tours...).
+
+Côté solveur :
+
+    stats = record("min_presses", buttons=len(buttons))
+    ...
+    if stats is not None:
+        stats["nodes"] += 1
+
+Quand l'instrumentation est désactivée (par défaut), record() renvoie None
+et le seul coût est ce test "is not None".
+
+Usage :
+
+    python -m tools.instrument --days 10 12 --input test_inputs.txt -o stats.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class Recorder:
+    """Un enregistrement par appel instrumenté (une machine, une région...)."""
+
+    def __init__(self) -> None:
+        self.records: List[Dict[str, Any]] = []
+
+    def record(self, kind: str, **meta: Any) -> Counter:
+        counters: Counter = Counter()
+        self.records.append({"kind": kind, "index": len(self.records), **meta, "counters": counters})
+        return counters
+
+    def to_json(self) -> List[Dict[str, Any]]:
+        return [{**r, "counters": dict(r["counters"])} for r in self.records]
+
+
+_recorder: Optional[Recorder] = None
+
+
+def record(kind: str, **meta: Any) -> Optional[Counter]:
+    """Compteurs d'un nouvel appel, ou None si l'instrumentation est coupée."""
+    if _recorder is None:
+        return None
+    return _recorder.record(kind, **meta)
+
+
+@contextlib.contextmanager
+def recording() -> Iterator[Recorder]:
+    """Active l'instrumentation le temps du bloc."""
+    global _recorder
+    previous = _recorder
+    _recorder = Recorder()
+    try:
+        yield _recorder
+    finally:
+        _recorder = previous
+
+
+def main() -> None:
+    # Sous "python -m", ce module est __main__ : les solveurs, eux, importent
+    # tools.instrument. On passe donc par ce dernier pour activer le recorder.
+    from tools import instrument
+    from tools.bench import quiet
+    from tools.solvers import discover, load_module, run_parse, run_solve
+
+    parser = argparse.ArgumentParser(description="Exécute les solveurs avec les compteurs activés.")
+    parser.add_argument("--days", type=int, nargs="*", help="jours à lancer (défaut : tous)")
+    parser.add_argument("--input", default="inputs.txt", help="nom du fichier d'entrée dans chaque dossier dayN")
+    parser.add_argument("-o", "--output", type=Path, help="fichier JSON (défaut : stdout)")
+    parser.add_argument("--top", type=int, default=3, help="affiche les N enregistrements les plus coûteux")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {}
+    for spec in discover(args.days):
+        input_path = spec.path.parent / args.input
+        if not input_path.exists():
+            continue
+        module = load_module(spec)
+        with instrument.recording() as rec, quiet():
+            run_solve(spec, module, run_parse(spec, module, input_path))
+        if rec.records:
+            report[spec.name] = rec.to_json()
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    else:
+        print(json.dumps(report, indent=2))
+
+    # Résumé : les enregistrements les plus lourds (somme des compteurs).
+    for name, records in report.items():
+        heaviest = sorted(records, key=lambda r: sum(r["counters"].values()), reverse=True)[: args.top]
+        for r in heaviest:
+            meta = {k: v for k, v in r.items() if k not in ("kind", "counters")}
+            print(f"# {name} {r['kind']} {meta} {r['counters']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
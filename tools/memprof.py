@@ -0,0 +1,185 @@
+"""
+Profil mémoire d'un solveur, phase par phase (parse puis solve), avec
+tracemalloc : pic, principaux sites d'allocation et nombre d'objets créés
+par type. Utilisé par "python -m tools.bench --memory-profile".
+
+tracemalloc n'a pas de callback : un thread échantillonneur relève la
+mémoire tracée toutes les quelques ms et, si un budget est donné et
+dépassé, fige l'état (instantané tracemalloc + objets vivants) puis
+interrompt le thread principal : la phase est abandonnée avec
+MemoryBudgetExceeded et le rapport montre où elle allouait. Sans
+dépassement, sites et objets décrivent l'état en fin de phase ; le pic,
+lui, est exact.
+
+L'interruption n'a lieu qu'entre deux instructions Python : un appel C
+très long (un sorted() géant) va au bout avant d'être arrêté.
+"""
+
+from __future__ import annotations
+
+import _thread
+import gc
+import threading
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SAMPLE_INTERVAL = 0.005
+
+_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def parse_size(text: str) -> int:
+    """'512M', '2G', '1500K' ou un nombre d'octets."""
+    text = text.strip().upper().removesuffix("B").removesuffix("I")
+    unit = text[-1:] if text[-1:] in _UNITS else ""
+    return int(float(text[: len(text) - len(unit)]) * _UNITS[unit])
+
+
+@dataclass
+class PhaseProfile:
+    phase: str
+    peak_bytes: int = 0
+    # (fichier:ligne, octets, nombre de blocs) encore alloués à la fin (ou au dépassement)
+    top_sites: List[Tuple[str, int, int]] = field(default_factory=list)
+    # objets suivis par le GC créés depuis le début de la phase et encore vivants, par type
+    objects: Dict[str, int] = field(default_factory=dict)
+    aborted: bool = False
+
+
+class MemoryBudgetExceeded(Exception):
+    def __init__(self, profile: PhaseProfile, budget: int):
+        self.profile = profile
+        self.budget = budget
+        where = profile.top_sites[0][0] if profile.top_sites else "?"
+        super().__init__(
+            f"{profile.phase}: budget de {budget / 2**20:.1f} MiB dépassé "
+            f"({profile.peak_bytes / 2**20:.1f} MiB), allocations surtout en {where}"
+        )
+
+
+def _type_counts() -> Counter:
+    return Counter(type(o).__name__ for o in gc.get_objects())
+
+
+class _Sampler(threading.Thread):
+    def __init__(self, profile: PhaseProfile, top: int, budget: Optional[int], baseline: Counter):
+        super().__init__(daemon=True)
+        self.profile = profile
+        self.top = top
+        self.budget = budget
+        self.baseline = baseline
+        self.stop_event = threading.Event()
+        self.tripped = False
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.objects: Optional[List[Any]] = None
+        # Empêche d'interrompre le thread principal une fois fn terminée.
+        self.lock = threading.Lock()
+        self.done = False
+
+    def capture(self) -> None:
+        # take_snapshot() et gc.get_objects() sont en C et gardent le GIL :
+        # l'état est figé d'un coup ; le dépouillement (lent) se fait dans
+        # summarize(), une fois le thread principal arrêté.
+        self.snapshot = tracemalloc.take_snapshot()
+        self.objects = gc.get_objects()
+
+    def summarize(self) -> None:
+        snapshot = self.snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, threading.__file__),
+        ])
+        self.profile.top_sites = [
+            (str(stat.traceback[0]), stat.size, stat.count)
+            for stat in snapshot.statistics("lineno")[: self.top]
+        ]
+        counts = Counter(type(o).__name__ for o in self.objects) - self.baseline
+        self.profile.objects = dict(counts.most_common(self.top))
+        self.snapshot = self.objects = None
+
+    def run(self) -> None:
+        if self.budget is None:
+            return
+        while not self.stop_event.wait(SAMPLE_INTERVAL):
+            if tracemalloc.get_traced_memory()[0] > self.budget:
+                with self.lock:
+                    if not self.done:
+                        self.capture()
+                        self.tripped = True
+                        _thread.interrupt_main()
+                return
+
+
+def profile_phase(
+    phase: str,
+    fn: Callable[[], Any],
+    top: int = 10,
+    budget: Optional[int] = None,
+) -> Tuple[PhaseProfile, Any]:
+    """
+    Exécute fn sous tracemalloc. Seules les allocations faites pendant fn
+    sont comptées (les données d'une phase précédente ne le sont pas).
+    Lève MemoryBudgetExceeded si la mémoire tracée dépasse budget octets.
+    """
+    profile = PhaseProfile(phase)
+    sampler = _Sampler(profile, top, budget, _type_counts())
+    tracemalloc.start()
+    sampler.start()
+    result = None
+    try:
+        result = fn()
+        with sampler.lock:
+            sampler.done = True
+    except KeyboardInterrupt:
+        if not sampler.tripped:
+            raise
+    finally:
+        sampler.stop_event.set()
+        sampler.join()
+        profile.peak_bytes = tracemalloc.get_traced_memory()[1]
+        if not sampler.tripped:
+            sampler.capture()
+        tracemalloc.stop()
+        sampler.summarize()
+
+    if sampler.tripped:
+        profile.aborted = True
+        raise MemoryBudgetExceeded(profile, budget)
+    return profile, result
+
+
+def profile_solver(spec, input_path, top: int = 10, budget: Optional[int] = None) -> Dict[str, Any]:
+    """Profils parse et solve d'une solution ; s'arrête à la première phase hors budget."""
+    from tools.bench import quiet
+    from tools.solvers import load_module, run_parse, run_solve
+
+    module = load_module(spec)
+    report: Dict[str, Any] = {"solver": spec.name, "phases": [], "error": None}
+    try:
+        with quiet():
+            parse_profile, data = profile_phase("parse", lambda: run_parse(spec, module, input_path), top, budget)
+            report["phases"].append(asdict(parse_profile))
+            solve_profile, _ = profile_phase("solve", lambda: run_solve(spec, module, data), top, budget)
+            report["phases"].append(asdict(solve_profile))
+    except MemoryBudgetExceeded as exc:
+        report["phases"].append(asdict(exc.profile))
+        report["error"] = str(exc)
+    return report
+
+
+def format_profiles(reports: List[Dict[str, Any]]) -> str:
+    lines: List[str] = []
+    for report in reports:
+        for ph in report["phases"]:
+            flag = "  ABANDON (budget)" if ph["aborted"] else ""
+            lines.append(f"{report['solver']:<16} {ph['phase']:<6} pic {ph['peak_bytes'] / 1024:>12.1f} KiB{flag}")
+            for site, size, count in ph["top_sites"]:
+                lines.append(f"    {size / 1024:>12.1f} KiB {count:>9} blocs  {site}")
+            if ph["objects"]:
+                objs = ", ".join(f"{name}={n}" for name, n in ph["objects"].items())
+                lines.append(f"    objets : {objs}")
+        if report["error"]:
+            lines.append(f"    ! {report['error']}")
+    return "\n".join(lines)
@@ -0,0 +1,745 @@
+#!/usr/bin/env python3
+"""
+Harnais différentiel : chaque solveur est comparé à un oracle "force brute"
+sur des milliers de petites entrées aléatoires générées. Un désaccord, ou
+une exception levée par l'un ou l'autre, est un échec : l'entrée est
+réduite (suppression de lignes / d'éléments tant que le même échec
+persiste et que l'entrée reste dans le domaine du jour) avant d'être
+affichée. Les moteurs hors parse/solve (flux, tuiles, multi-cadrans) ont
+leurs propres cas.
+
+Les oracles travaillent directement sur le texte de l'entrée et ne
+réutilisent pas le code des solutions : ils sont volontairement naïfs.
+
+Usage :
+
+    python -m tools.oracle --trials 2000
+    python -m tools.oracle --only day4/solution2 day9/solution2 --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import itertools
+import random
+import re
+import sys
+import tempfile
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from tools.bench import quiet
+from tools.generators import generate
+from tools.solvers import get_spec, load_module, run_parse, run_solve
+
+NEIGHBOURS_8 = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+# ------------------------------------------------------------
+# Oracles
+# ------------------------------------------------------------
+
+def _rotations(text: str) -> List[Tuple[int, int]]:
+    return [(-1 if line[0] == "L" else 1, int(line[1:])) for line in text.split()]
+
+
+def oracle_day1_dial(start: int = 50, modulus: int = 100) -> Callable[[str], Tuple[int, int]]:
+    """(zéros en fin de rotation, zéros à chaque clic) pour un cadran quelconque."""
+    def oracle(text: str) -> Tuple[int, int]:
+        # Partie 2 : chaque "clic" qui amène le cadran sur 0 compte, pendant ou à la fin.
+        pos, landed, clicks = start % modulus, 0, 0
+        for sign, steps in _rotations(text):
+            for _ in range(steps):
+                pos = (pos + sign) % modulus
+                clicks += pos == 0
+            landed += pos == 0
+        return landed, clicks
+
+    return oracle
+
+
+def oracle_day1_part1(text: str) -> int:
+    return oracle_day1_dial()(text)[0]
+
+
+def oracle_day1_part2(text: str) -> int:
+    return oracle_day1_dial()(text)[1]
+
+
+def _ranges(text: str) -> List[Tuple[int, int]]:
+    return [tuple(map(int, r.split("-"))) for r in text.strip().strip(",").split(",")]
+
+
+def oracle_day2(pattern: str) -> Callable[[str], int]:
+    regex = re.compile(pattern)
+
+    def oracle(text: str) -> int:
+        # Un ID couvert par plusieurs plages ne compte qu'une fois.
+        ids = {n for a, b in _ranges(text) for n in range(a, b + 1)}
+        return sum(n for n in ids if regex.fullmatch(str(n)))
+
+    return oracle
+
+
+def oracle_day3(k: int) -> Callable[[str], int]:
+    def oracle(text: str) -> int:
+        return sum(
+            max(int("".join(c)) for c in itertools.combinations(bank, k))
+            for bank in text.split()
+        )
+
+    return oracle
+
+
+def _grid(text: str) -> List[List[str]]:
+    return [list(line) for line in text.splitlines() if line]
+
+
+def _accessible(grid: List[List[str]], i: int, j: int) -> bool:
+    n = sum(
+        1 for di, dj in NEIGHBOURS_8
+        if 0 <= i + di < len(grid) and 0 <= j + dj < len(grid[0]) and grid[i + di][j + dj] == "@"
+    )
+    return grid[i][j] == "@" and n < 4
+
+
+def oracle_day4_part1(text: str) -> int:
+    grid = _grid(text)
+    return sum(_accessible(grid, i, j) for i in range(len(grid)) for j in range(len(grid[0])))
+
+
+def oracle_day4_part2(text: str) -> int:
+    # Retire un seul rouleau à la fois et rescanne tout : même point fixe.
+    grid = _grid(text)
+    removed = 0
+    while True:
+        cell = next(
+            ((i, j) for i in range(len(grid)) for j in range(len(grid[0])) if _accessible(grid, i, j)),
+            None,
+        )
+        if cell is None:
+            return removed
+        grid[cell[0]][cell[1]] = "."
+        removed += 1
+
+
+def _fresh_sections(text: str) -> Tuple[List[Tuple[int, int]], List[int]]:
+    head, _, tail = text.partition("\n\n")
+    ranges = [tuple(map(int, line.split("-"))) for line in head.split()]
+    return ranges, [int(x) for x in tail.split()]
+
+
+def oracle_day5_part1(text: str) -> int:
+    ranges, ids = _fresh_sections(text)
+    return sum(any(a <= x <= b for a, b in ranges) for x in ids)
+
+
+def oracle_day5_part2(text: str) -> int:
+    ranges, _ = _fresh_sections(text)
+    covered: Set[int] = set()
+    for a, b in ranges:
+        covered.update(range(a, b + 1))
+    return len(covered)
+
+
+def _apply(op: str, nums: List[int]) -> int:
+    value = 0 if op == "+" else 1
+    for n in nums:
+        value = value + n if op == "+" else value * n
+    return value
+
+
+def oracle_day6_part1(text: str) -> int:
+    rows = [line.split() for line in text.splitlines() if line.strip()]
+    *numbers, ops = rows
+    return sum(_apply(op, [int(r[k]) for r in numbers]) for k, op in enumerate(ops))
+
+
+def oracle_day6_part2(text: str) -> int:
+    lines = [line for line in text.splitlines() if line.strip()]
+    width = max(map(len, lines))
+    lines = [line.ljust(width) for line in lines]
+    # Colonnes entièrement vides = séparateurs entre problèmes.
+    total, cols = 0, []
+    for c in list(range(width)) + [width]:
+        if c == width or all(line[c] == " " for line in lines):
+            if cols:
+                op = "".join(lines[-1][x] for x in cols).strip()
+                nums = [int("".join(line[x] for line in lines[:-1]).replace(" ", "")) for x in reversed(cols)]
+                total += _apply(op, nums)
+            cols = []
+        else:
+            cols.append(c)
+    return total
+
+
+def _start(grid: List[str]) -> Tuple[int, int]:
+    return next((r, line.index("S")) for r, line in enumerate(grid) if "S" in line)
+
+
+def oracle_day7_part1(text: str) -> int:
+    grid = text.splitlines()
+    r0, c0 = _start(grid)
+    hit: Set[Tuple[int, int]] = set()
+    seen: Set[Tuple[int, int]] = set()
+    stack = [(r0 + 1, c0)]
+    while stack:
+        r, c = stack.pop()
+        if (r, c) in seen or r >= len(grid) or not 0 <= c < len(grid[0]):
+            continue
+        seen.add((r, c))
+        if grid[r][c] == "^":
+            hit.add((r, c))
+            stack += [(r + 1, c - 1), (r + 1, c + 1)]
+        else:
+            stack.append((r + 1, c))
+    return len(hit)
+
+
+def oracle_day7_part2(text: str) -> int:
+    grid = text.splitlines()
+    r0, c0 = _start(grid)
+
+    def timelines(r: int, c: int) -> int:  # pas de mémo : exponentiel, voulu
+        if r >= len(grid) or not 0 <= c < len(grid[0]):
+            return 1
+        if grid[r][c] == "^":
+            return timelines(r + 1, c - 1) + timelines(r + 1, c + 1)
+        return timelines(r + 1, c)
+
+    return timelines(r0 + 1, c0)
+
+
+def _points(text: str) -> List[Tuple[int, ...]]:
+    return [tuple(map(int, line.split(","))) for line in text.split()]
+
+
+def _sorted_edges(points: List[Tuple[int, ...]]) -> List[Tuple[int, int, int]]:
+    edges = [
+        (sum((a - b) ** 2 for a, b in zip(points[i], points[j])), i, j)
+        for i in range(len(points)) for j in range(i + 1, len(points))
+    ]
+    return sorted(edges, key=lambda e: e[0])
+
+
+def _components(n: int, edges: List[Tuple[int, int, int]]) -> List[int]:
+    adj: Dict[int, List[int]] = {i: [] for i in range(n)}
+    for _, i, j in edges:
+        adj[i].append(j)
+        adj[j].append(i)
+    seen: Set[int] = set()
+    sizes = []
+    for s in range(n):
+        if s in seen:
+            continue
+        seen.add(s)
+        queue, size = deque([s]), 0
+        while queue:
+            u = queue.popleft()
+            size += 1
+            for v in adj[u]:
+                if v not in seen:
+                    seen.add(v)
+                    queue.append(v)
+        sizes.append(size)
+    return sizes
+
+
+def oracle_day8_part1(connections: int) -> Callable[[str], int]:
+    def oracle(text: str) -> int:
+        points = _points(text)
+        sizes = sorted(_components(len(points), _sorted_edges(points)[:connections]), reverse=True)
+        sizes += [1] * 3
+        return sizes[0] * sizes[1] * sizes[2]
+
+    return oracle
+
+
+def oracle_day8_part2(text: str) -> int:
+    points = _points(text)
+    edges = _sorted_edges(points)
+    for k in range(1, len(edges) + 1):
+        if len(_components(len(points), edges[:k])) == 1:
+            _, i, j = edges[k - 1]
+            return points[i][0] * points[j][0]
+    return 0
+
+
+def oracle_day9_part1(text: str) -> int:
+    pts = _points(text)
+    return max(
+        (abs(a[0] - b[0]) + 1) * (abs(a[1] - b[1]) + 1)
+        for a, b in itertools.combinations(pts, 2)
+    ) if len(pts) > 1 else 0
+
+
+def oracle_day9_part2(text: str) -> int:
+    # Tuile par tuile : chaque tuile du rectangle doit être sur le bord
+    # du polygone ou à l'intérieur (parité des croisements).
+    pts = _points(text)
+    n = len(pts)
+    segs = [(pts[i], pts[(i + 1) % n]) for i in range(n)]
+
+    def ok(x: int, y: int) -> bool:
+        inside = False
+        for (x1, y1), (x2, y2) in segs:
+            if min(x1, x2) <= x <= max(x1, x2) and min(y1, y2) <= y <= max(y1, y2):
+                return True
+            if x1 == x2 and x1 > x and min(y1, y2) <= y < max(y1, y2):
+                inside = not inside
+        return inside
+
+    best = 0
+    for a, b in itertools.combinations(pts, 2):
+        xs = range(min(a[0], b[0]), max(a[0], b[0]) + 1)
+        ys = range(min(a[1], b[1]), max(a[1], b[1]) + 1)
+        if len(xs) * len(ys) > best and all(ok(x, y) for x in xs for y in ys):
+            best = len(xs) * len(ys)
+    return best
+
+
+def _machines(text: str):
+    for line in text.splitlines():
+        lights = line[line.index("[") + 1 : line.index("]")]
+        buttons = [[int(v) for v in b.split(",")] for b in re.findall(r"\(([^)]*)\)", line)]
+        target = [int(v) for v in re.search(r"\{([^}]*)\}", line).group(1).split(",")]
+        yield lights, buttons, target
+
+
+def oracle_day10_part1(text: str) -> int:
+    total = 0
+    for lights, buttons, _ in _machines(text):
+        goal = [c == "#" for c in lights]
+        for k in range(len(buttons) + 1):
+            if any(
+                [sum(i in buttons[b] for b in combo) % 2 == 1 for i in range(len(lights))] == goal
+                for combo in itertools.combinations(range(len(buttons)), k)
+            ):
+                total += k
+                break
+    return total
+
+
+def oracle_day10_part2(text: str) -> int:
+    total = 0
+    for _, buttons, target in _machines(text):
+        best: List[Optional[int]] = [None]
+
+        def search(b: int, remaining: List[int], presses: int) -> None:
+            if b == len(buttons):
+                if not any(remaining) and (best[0] is None or presses < best[0]):
+                    best[0] = presses
+                return
+            for k in range(min(remaining[i] for i in buttons[b]) + 1):
+                search(b + 1, [r - k if i in buttons[b] else r for i, r in enumerate(remaining)], presses + k)
+
+        search(0, target, 0)
+        total += best[0]
+    return total
+
+
+def _graph(text: str) -> Dict[str, List[str]]:
+    graph = {}
+    for line in text.splitlines():
+        src, _, dst = line.partition(":")
+        graph[src.strip()] = dst.split()
+    return graph
+
+
+def _all_paths(graph: Dict[str, List[str]], node: str, end: str, path: List[str]):
+    if node == end:
+        yield path
+        return
+    for nxt in graph.get(node, []):
+        yield from _all_paths(graph, nxt, end, path + [nxt])
+
+
+def oracle_day11_part1(text: str) -> int:
+    return sum(1 for _ in _all_paths(_graph(text), "you", "out", ["you"]))
+
+
+def oracle_day11_part2(text: str) -> Tuple[int, int]:
+    paths = list(_all_paths(_graph(text), "svr", "out", ["svr"]))
+    return len(paths), sum(1 for p in paths if "dac" in p and "fft" in p)
+
+
+def oracle_day12(text: str) -> int:
+    blocks = text.strip().split("\n\n")
+    shapes = []
+    for block in blocks[:-1]:
+        rows = block.splitlines()[1:]
+        cells = {(x, y) for y, row in enumerate(rows) for x, ch in enumerate(row) if ch == "#"}
+        variants = set()
+        for flip in (False, True):
+            cur = {(-x, y) for x, y in cells} if flip else cells
+            for _ in range(4):
+                mx, my = min(x for x, _ in cur), min(y for _, y in cur)
+                variants.add(frozenset((x - mx, y - my) for x, y in cur))
+                cur = {(y, -x) for x, y in cur}
+        shapes.append(variants)
+
+    ok = 0
+    for line in blocks[-1].splitlines():
+        dims, _, counts = line.partition(":")
+        W, H = map(int, dims.split("x"))
+        pieces = [s for s, c in enumerate(map(int, counts.split())) for _ in range(c)]
+
+        def place(k: int, used: Set[Tuple[int, int]]) -> bool:
+            if k == len(pieces):
+                return True
+            for v in shapes[pieces[k]]:
+                for ox in range(W):
+                    for oy in range(H):
+                        cells = {(x + ox, y + oy) for x, y in v}
+                        if all(x < W and y < H for x, y in cells) and not cells & used:
+                            if place(k + 1, used | cells):
+                                return True
+            return False
+
+        ok += place(0, set())
+    return ok
+
+
+# ------------------------------------------------------------
+# Harnais
+# ------------------------------------------------------------
+
+def _lines(text: str) -> List[str]:
+    return text.splitlines()
+
+
+def _join_lines(units: List[str]) -> str:
+    return "\n".join(units) + "\n"
+
+
+# ------------------------------------------------------------
+# Domaines des entrées : la réduction ne doit pas en sortir
+# ------------------------------------------------------------
+
+def _any_text(text: str) -> bool:
+    return True
+
+
+def _at_least(n: int) -> Callable[[str], bool]:
+    return lambda text: len(text.split()) >= n
+
+
+def _fresh_valid(text: str) -> bool:
+    # Plages, ligne vide, IDs : la ligne vide ne doit pas disparaître.
+    return "\n\n" in text
+
+
+def _worksheet_valid(text: str) -> bool:
+    lines = [line for line in text.splitlines() if line.strip()]
+    return (
+        len(lines) >= 2
+        and set(lines[-1]) <= set("+* ")
+        and all(set(line) <= set("0123456789 ") for line in lines[:-1])
+    )
+
+
+def _manifold_valid(text: str) -> bool:
+    grid = text.splitlines()
+    return bool(grid) and "S" in grid[0] and len({len(line) for line in grid}) == 1
+
+
+def _rectilinear_polygon(text: str) -> bool:
+    """Polygone simple dont les côtés sont alternativement horizontaux et verticaux."""
+    try:
+        pts = _points(text)
+    except ValueError:
+        return False
+    n = len(pts)
+    if n < 4 or n % 2 or len(set(pts)) != n or any(len(p) != 2 for p in pts):
+        return False
+    segs = [(pts[i], pts[(i + 1) % n]) for i in range(n)]
+    vertical = [a[0] == b[0] for a, b in segs]
+    if any(a[0] != b[0] and a[1] != b[1] for a, b in segs) or any(vertical[i] == vertical[i - 1] for i in range(n)):
+        return False
+    # Deux côtés non consécutifs ne se touchent pas (un segment aligné est sa boîte englobante).
+    for i in range(n):
+        for j in range(i + 2, n - (i == 0)):
+            (a, b), (c, d) = segs[i], segs[j]
+            if (max(min(a[0], b[0]), min(c[0], d[0])) <= min(max(a[0], b[0]), max(c[0], d[0]))
+                    and max(min(a[1], b[1]), min(c[1], d[1])) <= min(max(a[1], b[1]), max(c[1], d[1]))):
+                return False
+    return True
+
+
+def _has_source(node: str) -> Callable[[str], bool]:
+    return lambda text: any(line.partition(":")[0].strip() == node for line in text.splitlines())
+
+
+def _regions_split(text: str) -> List[str]:
+    # Les formes restent groupées (une unité par forme) ; chaque région est une unité.
+    blocks = text.strip().split("\n\n")
+    return blocks[:-1] + blocks[-1].splitlines()
+
+
+def _regions_join(units: List[str]) -> str:
+    shapes = [u for u in units if "\n" in u]
+    regions = [u for u in units if "\n" not in u]
+    return "\n\n".join(shapes + ["\n".join(regions)]) + "\n"
+
+
+def _regions_valid(text: str) -> bool:
+    blocks = text.strip().split("\n\n")
+    if len(blocks) < 2:
+        return False
+    return all(len(line.partition(":")[2].split()) == len(blocks) - 1 for line in blocks[-1].splitlines())
+
+
+# ------------------------------------------------------------
+# Moteurs sans entrée dans tools.solvers (flux, tuiles...)
+# ------------------------------------------------------------
+
+def _neighbour(name: str):
+    # Le dossier du jour est déjà dans sys.path : load_module l'y a mis.
+    return importlib.import_module(name)
+
+
+def day1_stream(module, path: Path) -> Tuple[int, int]:
+    # Morceaux minuscules : le recollage est exercé à chaque essai.
+    return _neighbour("stream").solve_stream(path, workers=1, chunk_bytes=8)
+
+
+def day1_multidial(start: int, modulus: int) -> Callable[[Any, Path], Tuple[int, int]]:
+    def multidial(module, path: Path) -> Tuple[int, int]:
+        dials = _neighbour("multidial")
+        part1, part2 = dials.simulate_dials(*dials.read_log(path), [start], [modulus])
+        return int(part1[0]), int(part2[0])
+
+    return multidial
+
+
+def day3_stream(module, path: Path) -> int:
+    return module.start_analysing_stream(str(path))
+
+
+def day4_tiled(part: int) -> Callable[[Any, Path], int]:
+    def tiled(module, path: Path) -> int:
+        # Tuiles de 3 cases : presque tous les rouleaux touchent un halo.
+        return _neighbour("tiled").solve_tiled(path, part, tile_size=3, workers=1)
+
+    return tiled
+
+
+@dataclass(frozen=True)
+class OracleCase:
+    """
+    solver : nom du solveur testé (cf. tools.solvers).
+    oracle : implémentation de référence, prend le texte de l'entrée.
+    gen    : paramètres aléatoires du générateur (dont 'size') pour un essai.
+    params : paramètres passés au solve.
+    split / join : découpage en unités pour la réduction des cas en échec.
+    valid  : domaine des entrées ; la réduction n'essaie que des entrées valides.
+    run    : autre point d'entrée (module de la solution, chemin) -> réponse,
+             pour les moteurs hors du parse/solve de tools.solvers.
+    name   : nom de ce moteur dans le rapport.
+    """
+    solver: str
+    oracle: Callable[[str], Any]
+    gen: Callable[[random.Random], Dict[str, Any]]
+    params: Dict[str, Any] = field(default_factory=dict)
+    split: Callable[[str], List[str]] = _lines
+    join: Callable[[List[str]], str] = _join_lines
+    valid: Callable[[str], bool] = _any_text
+    run: Optional[Callable[[Any, Path], Any]] = None
+    name: str = ""
+
+    @property
+    def label(self) -> str:
+        extra = " ".join(f"{k}={v}" for k, v in self.params.items())
+        if self.name:
+            extra = f"{self.name} {extra}"
+        return f"{self.solver} {extra}".strip()
+
+
+def _sized(lo: int, hi: int, **fixed: Any) -> Callable[[random.Random], Dict[str, Any]]:
+    return lambda rng: {"size": rng.randint(lo, hi), **fixed}
+
+
+
+_day1_gen = _sized(1, 30, max_step=250)
+_day3_gen = lambda rng: {"size": rng.randint(1, 5), "width": rng.randint(2, 15)}
+_day3_gen12 = lambda rng: {"size": rng.randint(1, 5), "width": rng.randint(12, 15)}
+_day4_gen = lambda rng: {"size": rng.randint(1, 8), "width": rng.randint(1, 8)}
+_day7_gen = lambda rng: {"size": rng.randint(2, 14), "width": rng.randint(3, 9)}
+_day2_split = {"split": lambda t: t.strip().split(","), "join": lambda u: ",".join(u) + "\n"}
+# Chiffres de l'index = max_digits du générateur : toutes les plages y tiennent.
+_day2_gen = _sized(1, 4, width=300, max_digits=6)
+_day2_index = {"engine": "index", "index_digits": 6}
+# Au-delà de multidial.BINCOUNT_MAX_MODULUS (1 << 16) : comptage par tri, pas par histogramme.
+_large_dial = (100, (1 << 16) + 1)
+
+CASES: List[OracleCase] = [
+    OracleCase("day1/solution1", oracle_day1_part1, _day1_gen),
+    OracleCase("day1/solution1", oracle_day1_part1, _day1_gen, {"engine": "numpy"}),
+    OracleCase("day1/solution2", oracle_day1_part2, _day1_gen),
+    OracleCase("day1/solution2", oracle_day1_part2, _day1_gen, {"engine": "numpy"}),
+    OracleCase("day1/solution1", oracle_day1_dial(), _day1_gen, run=day1_stream, name="stream"),
+    OracleCase("day1/solution1", oracle_day1_dial(), _day1_gen, run=day1_multidial(50, 100), name="multidial 50:100"),
+    OracleCase("day1/solution1", oracle_day1_dial(3, 7), _day1_gen, run=day1_multidial(3, 7), name="multidial 3:7"),
+    OracleCase("day1/solution1", oracle_day1_dial(*_large_dial), _day1_gen, run=day1_multidial(*_large_dial), name="multidial 100:65537"),
+    OracleCase("day2/solution1", oracle_day2(r"(\d+)\1"), _day2_gen, **_day2_split),
+    OracleCase("day2/solution1", oracle_day2(r"(\d+)\1"), _day2_gen, _day2_index, **_day2_split),
+    OracleCase("day2/solution1", oracle_day2(r"(\d+)\1"), _day2_gen, {"engine": "loop"}, **_day2_split),
+    OracleCase("day2/solution2", oracle_day2(r"(\d+)\1+"), _day2_gen, **_day2_split),
+    OracleCase("day2/solution2", oracle_day2(r"(\d+)\1+"), _day2_gen, _day2_index, **_day2_split),
+    OracleCase("day2/solution2", oracle_day2(r"(\d+)\1+"), _day2_gen, {"engine": "loop"}, **_day2_split),
+    OracleCase("day3/solution1", oracle_day3(2), _day3_gen),
+    OracleCase("day3/solution1", oracle_day3(2), _day3_gen, {"engine": "loop"}),
+    OracleCase("day3/solution1", oracle_day3(2), _day3_gen, run=day3_stream, name="stream"),
+    OracleCase("day3/solution2", oracle_day3(12), _day3_gen12),
+    OracleCase("day3/solution2", oracle_day3(12), _day3_gen12, {"engine": "loop"}),
+    OracleCase("day3/solution2", oracle_day3(12), _day3_gen12, run=day3_stream, name="stream"),
+    OracleCase("day4/solution1", oracle_day4_part1, _day4_gen),
+    OracleCase("day4/solution1", oracle_day4_part1, _day4_gen, {"engine": "bitboard"}),
+    OracleCase("day4/solution1", oracle_day4_part1, _day4_gen, {"engine": "loop"}),
+    OracleCase("day4/solution1", oracle_day4_part1, _day4_gen, run=day4_tiled(1), name="tiled"),
+    OracleCase("day4/solution2", oracle_day4_part2, _day4_gen),
+    OracleCase("day4/solution2", oracle_day4_part2, _day4_gen, {"engine": "bitboard"}),
+    OracleCase("day4/solution2", oracle_day4_part2, _day4_gen, {"engine": "scan"}),
+    OracleCase("day4/solution2", oracle_day4_part2, _day4_gen, run=day4_tiled(2), name="tiled"),
+    OracleCase("day5/solution1", oracle_day5_part1, _sized(1, 8, max_id=200, width=30), valid=_fresh_valid),
+    OracleCase("day5/solution2", oracle_day5_part2, _sized(1, 8, max_id=200, width=30), valid=_fresh_valid),
+    OracleCase("day6/solution1", oracle_day6_part1, _sized(1, 6, max_digits=3), valid=_worksheet_valid),
+    OracleCase("day6/solution2", oracle_day6_part2, _sized(1, 6, max_digits=3), valid=_worksheet_valid),
+    OracleCase("day7/solution1", oracle_day7_part1, _day7_gen, valid=_manifold_valid),
+    OracleCase("day7/solution2", oracle_day7_part2, _day7_gen, valid=_manifold_valid),
+    OracleCase("day8/solution1", oracle_day8_part1(10), _sized(2, 25, max_coord=10 ** 6), {"connections": 10}, valid=_at_least(2)),
+    OracleCase("day8/solution2", oracle_day8_part2, _sized(2, 25, max_coord=10 ** 6), valid=_at_least(2)),
+    OracleCase("day9/solution1", oracle_day9_part1, _sized(4, 14, max_coord=40), valid=_rectilinear_polygon),
+    OracleCase("day9/solution2", oracle_day9_part2, _sized(4, 14, max_coord=40), valid=_rectilinear_polygon),
+    OracleCase("day10/solution1", oracle_day10_part1, _sized(1, 3, max_lights=5, max_press=3)),
+    OracleCase("day10/solution2", oracle_day10_part2, _sized(1, 3, max_lights=5, max_press=3)),
+    OracleCase("day11/solution1", oracle_day11_part1, _sized(6, 16, max_out=3), valid=_has_source("you")),
+    OracleCase("day11/solution2", oracle_day11_part2, _sized(6, 16, max_out=3), valid=_has_source("svr")),
+    OracleCase("day12/solution", oracle_day12, _sized(1, 3, num_shapes=3, min_dim=3, max_dim=5),
+               split=_regions_split, join=_regions_join, valid=_regions_valid),
+]
+
+
+@dataclass(frozen=True)
+class Crash:
+    """Exception levée par le solveur ou l'oracle, gardée comme résultat."""
+    error: str
+
+    def __repr__(self) -> str:
+        return f"<exception {self.error}>"
+
+
+def _outcome(fn: Callable[[str], Any], text: str) -> Any:
+    try:
+        return fn(text)
+    except Exception as exc:
+        return Crash(repr(exc))
+
+
+class Runner:
+    """Exécute le solveur d'un cas sur un texte (via un fichier temporaire)."""
+
+    def __init__(self, case: OracleCase, workdir: Path):
+        self.case = case
+        self.spec = get_spec(case.solver)
+        self.module = load_module(self.spec)
+        self.path = workdir / f"{self.spec.name.replace('/', '_')}.txt"
+
+    def solver(self, text: str) -> Any:
+        self.path.write_text(text, encoding="utf-8")
+        with quiet():
+            if self.case.run is not None:
+                return self.case.run(self.module, self.path)
+            data = run_parse(self.spec, self.module, self.path)
+            return run_solve(self.spec, self.module, data, self.case.params)
+
+    def outcomes(self, text: str) -> Tuple[Any, Any]:
+        """(réponse du solveur, réponse de l'oracle), une exception devenant un Crash."""
+        return _outcome(self.solver, text), _outcome(self.case.oracle, text)
+
+    def failure(self, text: str) -> Optional[str]:
+        """Signature de l'échec sur ce texte, ou None si les deux répondent pareil."""
+        got, expected = self.outcomes(text)
+        # La réduction garde la même exception, pas seulement le même côté :
+        # sinon elle dérive vers une entrée dégénérée qui plante autrement.
+        if isinstance(got, Crash):
+            return f"EXCEPTION (solveur) {got.error}"
+        if isinstance(expected, Crash):
+            return f"EXCEPTION (oracle) {expected.error}"
+        return "DÉSACCORD" if got != expected else None
+
+
+def shrink(runner: Runner, text: str, signature: str) -> str:
+    """Réduction gloutonne : on retire des blocs d'unités tant que le même échec persiste."""
+    units = runner.case.split(text)
+    chunk = max(1, len(units) // 2)
+    while chunk >= 1:
+        progress = False
+        i = 0
+        while i < len(units):
+            candidate = units[:i] + units[i + chunk :]
+            joined = runner.case.join(candidate)
+            if candidate and runner.case.valid(joined) and runner.failure(joined) == signature:
+                units = candidate
+                progress = True
+            else:
+                i += chunk
+        if not progress:
+            chunk //= 2
+    return runner.case.join(units)
+
+
+def check(case: OracleCase, trials: int, seed: int, workdir: Path) -> Optional[Dict[str, Any]]:
+    """Premier échec trouvé (réduit), ou None si tous les essais passent."""
+    runner = Runner(case, workdir)
+    day = runner.spec.day
+    for t in range(trials):
+        rng = random.Random(seed * 1_000_003 + t)
+        params = case.gen(rng)
+        size = params.pop("size")
+        text = generate(day, size, rng.randrange(1 << 30), **params)
+        signature = runner.failure(text)
+        if signature is not None:
+            small = shrink(runner, text, signature)
+            got, expected = runner.outcomes(small)
+            return {
+                "trial": t,
+                "kind": "DÉSACCORD" if signature == "DÉSACCORD" else "EXCEPTION",
+                "input": small,
+                "solver": got,
+                "oracle": expected,
+            }
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare chaque solveur à un oracle force brute.")
+    parser.add_argument("--trials", type=int, default=1000, help="essais par solveur")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="*", help="solveurs à tester, ex. day4/solution2")
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in CASES:
+            if args.only and case.solver not in args.only:
+                continue
+            failure = check(case, args.trials, args.seed, Path(tmp))
+            if failure is None:
+                print(f"{case.label:<32} ok ({args.trials} essais)")
+                continue
+            failures += 1
+            print(f"{case.label:<32} {failure['kind']} à l'essai {failure['trial']} : "
+                  f"solveur={failure['solver']!r} oracle={failure['oracle']!r}")
+            print("    entrée réduite :")
+            for line in failure["input"].splitlines():
+                print(f"    | {line}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Lance toutes les solutions dayN en parallèle, un processus fils par tâche
+(au plus --workers à la fois).
+
+Chaque tâche a son propre timeout : un solveur qui s'emballe (day12, day10...)
+est signalé et abandonné sans bloquer le reste. Le fils s'arrête de lui-même
+par SIGALRM quand c'est possible ; sinon (pas de SIGALRM, appel C qui ne rend
+pas la main) le parent le tue passé le délai. Les résultats sont affichés
+dans l'ordre de soumission.
+
+Usage :
+
+    python -m tools.parallel --workers 4 --timeout 60
+    python -m tools.parallel --days 8 10 12 --input test_inputs.txt
+    python -m tools.parallel --cache --param day8/solution1:connections=10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from collections import deque
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.bench import quiet
+from tools.cache import DEFAULT_MAX_ENTRIES, AnswerCache
+from tools.solvers import discover, get_spec, load_module, run_parse, run_solve
+
+
+# Délai laissé au SIGALRM du fils avant que le parent ne le tue.
+KILL_GRACE_S = 1.0
+
+
+class TaskTimeout(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise TaskTimeout()
+
+
+def run_task(
+    name: str,
+    input_name: str,
+    timeout: Optional[float] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Exécuté dans un processus fils : parse + solve d'une solution.
+    Le timeout est armé avec SIGALRM dans le fils quand la plateforme le
+    permet, ce qui rend un résultat "timeout" propre ; run_all tue de toute
+    façon le fils s'il dépasse le délai.
+    """
+    spec = get_spec(name)
+    input_path = spec.path.parent / input_name
+    module = load_module(spec)
+
+    use_alarm = timeout is not None and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    t0 = time.perf_counter()
+    try:
+        with quiet():
+            data = run_parse(spec, module, input_path)
+            t1 = time.perf_counter()
+            answer = run_solve(spec, module, data, params)
+            t2 = time.perf_counter()
+    except TaskTimeout:
+        return {"status": "timeout", "elapsed_s": time.perf_counter() - t0}
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    return {"status": "ok", "answer": answer, "parse_s": t1 - t0, "solve_s": t2 - t1}
+
+
+def _task_main(conn, name: str, input_name: str, timeout: Optional[float], params: Optional[Dict[str, Any]]) -> None:
+    # Point d'entrée du processus fils : le résultat (ou l'erreur) repart par le tube.
+    try:
+        result = run_task(name, input_name, timeout, params)
+    except Exception as exc:  # erreur dans le solveur : on la rapporte
+        result = {"status": f"error: {exc!r}"}
+    conn.send(result)
+    conn.close()
+
+
+def _run_processes(
+    jobs: List[Tuple[str, str, Optional[float], Optional[Dict[str, Any]]]],
+    workers: Optional[int],
+    timeout: Optional[float],
+) -> List[Dict[str, Any]]:
+    """
+    Exécute chaque job (arguments de run_task) dans son propre processus,
+    au plus workers à la fois. Le délai court depuis le démarrage du fils ;
+    passé timeout + KILL_GRACE_S, le fils est tué et la tâche rapportée en
+    timeout.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    pending = deque(enumerate(jobs))
+    running: Dict[Any, Tuple[int, multiprocessing.Process, float]] = {}
+
+    while pending or running:
+        while pending and len(running) < workers:
+            i, args = pending.popleft()
+            recv, send = multiprocessing.Pipe(duplex=False)
+            proc = multiprocessing.Process(target=_task_main, args=(send, *args), daemon=True)
+            proc.start()
+            send.close()
+            running[recv] = (i, proc, time.monotonic())
+
+        now = time.monotonic()
+        wait_s = None
+        if timeout is not None:
+            wait_s = max(0.0, min(start + timeout + KILL_GRACE_S for _, _, start in running.values()) - now)
+        for conn in wait(list(running), wait_s):
+            i, proc, _ = running.pop(conn)
+            try:
+                results[i] = conn.recv()
+            except EOFError:  # le fils est mort sans répondre (signal, os._exit...)
+                proc.join()
+                results[i] = {"status": f"error: processus terminé (code {proc.exitcode})"}
+            conn.close()
+            proc.join()
+
+        if timeout is not None:
+            now = time.monotonic()
+            for conn, (i, proc, start) in list(running.items()):
+                if now - start >= timeout + KILL_GRACE_S:
+                    proc.kill()
+                    proc.join()
+                    conn.close()
+                    del running[conn]
+                    results[i] = {"status": "timeout", "elapsed_s": now - start}
+
+    return results
+
+
+def run_all(
+    names: List[str],
+    input_name: str = "inputs.txt",
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    cache: Optional[AnswerCache] = None,
+    params: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Lance une tâche par solution et collecte les résultats dans l'ordre
+    de soumission (pas dans l'ordre de fin).
+    Avec un cache, les réponses déjà connues ne sont pas recalculées.
+    params : paramètres du solve, par nom de solveur.
+    """
+    params = params or {}
+    rows: List[Dict[str, Any]] = []
+    keys: List[Optional[str]] = []
+    jobs, job_rows = [], []
+    for name in names:
+        row: Dict[str, Any] = {"solver": name}
+        key = None
+        if cache is not None:
+            spec = get_spec(name)
+            key, answer = cache.lookup(spec, spec.path.parent / input_name, params.get(name))
+            if not cache.is_miss(answer):
+                row.update({"status": "cached", "answer": answer})
+                rows.append(row)
+                keys.append(key)
+                continue
+        jobs.append((name, input_name, timeout, params.get(name)))
+        job_rows.append(row)
+        rows.append(row)
+        keys.append(key)
+
+    for row, result in zip(job_rows, _run_processes(jobs, workers, timeout)):
+        row.update(result)
+
+    for row, key in zip(rows, keys):
+        if cache is not None and row["status"] == "ok":
+            try:
+                cache.put(key, row["answer"], {"solver": row["solver"], "input": input_name})
+            except (TypeError, ValueError, OSError) as exc:  # la réponse reste valable, seule sa mise en cache échoue
+                print(f"# {row['solver']}: réponse non mise en cache ({exc!r})", file=sys.stderr)
+
+    return rows
+
+
+def parse_params(items: List[str]) -> Dict[str, Dict[str, Any]]:
+    """'day8/solution1:connections=10' -> {'day8/solution1': {'connections': 10}}"""
+    params: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        name, assignment = item.split(":", 1)
+        key, raw = assignment.split("=", 1)
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            value = raw
+        params.setdefault(name, {})[key] = value
+    return params
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    header = f"{'solver':<16} {'status':<8} {'parse ms':>10} {'solve ms':>10}  answer"
+    lines = [header, "-" * len(header)]
+    for row in results:
+        if row["status"] == "ok":
+            lines.append(
+                f"{row['solver']:<16} {'ok':<8} {row['parse_s'] * 1e3:>10.3f} "
+                f"{row['solve_s'] * 1e3:>10.3f}  {row['answer']}"
+            )
+        elif row["status"] == "cached":
+            lines.append(f"{row['solver']:<16} {'cached':<8} {'-':>10} {'-':>10}  {row['answer']}")
+        else:
+            lines.append(f"{row['solver']:<16} {row['status']}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Exécute toutes les solutions dayN en parallèle.")
+    parser.add_argument("--days", type=int, nargs="*", help="jours à lancer (défaut : tous)")
+    parser.add_argument("--input", default="inputs.txt", help="nom du fichier d'entrée dans chaque dossier dayN")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="nombre de processus")
+    parser.add_argument("--timeout", type=float, help="timeout par tâche, en secondes")
+    parser.add_argument("--cache", action="store_true", help="réutilise / enregistre les réponses dans le cache disque")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_ENTRIES, help="nombre max d'entrées du cache")
+    parser.add_argument("--param", action="append", default=[], metavar="SOLVER:NAME=VALUE",
+                        help="paramètre du solve, ex. day8/solution1:connections=10")
+    parser.add_argument("--json", type=Path, help="écrit aussi les résultats en JSON dans ce fichier")
+    args = parser.parse_args()
+
+    cache = AnswerCache(max_entries=args.cache_size) if args.cache else None
+
+    names = [s.name for s in discover(args.days) if (s.path.parent / args.input).exists()]
+    t0 = time.perf_counter()
+    results = run_all(names, args.input, args.workers, args.timeout, cache, parse_params(args.param))
+    elapsed = time.perf_counter() - t0
+
+    print(format_results(results))
+    print(f"\n{len(results)} tâches, {args.workers} workers, {elapsed:.2f} s au total")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2, default=str), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
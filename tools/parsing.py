@@ -0,0 +1,166 @@
+"""
+Lecture rapide des entrées, partagée par toutes les solutions dayN.
+
+Principe : on lit le fichier une seule fois en bytes, puis on laisse les
+méthodes C de bytes/str (replace, split, splitlines) et map(int, ...) faire
+le découpage, au lieu d'une boucle Python ligne par ligne avec strip().
+Les entiers sont rendus dans des array('q') (int64 contigus), ou en liste
+d'int Python s'ils dépassent int64.
+
+Si NumPy est installé, les gros fichiers d'entiers sont découpés de façon
+vectorisée (suites de chiffres repérées sur le buffer brut, valeurs
+recombinées par un schéma de Horner, une colonne de chiffres à la fois) ;
+sinon on reste sur map(int, ...).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # NumPy reste optionnel
+    np = None
+
+PathLike = Union[str, Path]
+
+# En dessous, le coût fixe de NumPy ne vaut pas le coup.
+NUMPY_MIN_BYTES = 1 << 16
+
+
+def read_bytes(path: PathLike) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@contextlib.contextmanager
+def mapped(path: PathLike) -> Iterator[Union[mmap.mmap, bytes]]:
+    """
+    Projette le fichier en mémoire (lecture seule). Pour les gros fichiers
+    parcourus par tranches : rien n'est copié tant qu'on ne découpe pas.
+    Un fichier vide donne b"" (mmap refuse une taille nulle).
+    """
+    with open(path, "rb") as f:
+        if Path(path).stat().st_size == 0:
+            yield b""
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+
+
+def _digit_runs_numpy(data: bytes) -> Optional[array]:
+    """
+    Toutes les suites de chiffres de data, en un seul passage vectorisé.
+    Retourne None si une suite dépasse 18 chiffres (débordement int64).
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    is_digit = (buf >= 48) & (buf <= 57)
+    edges = np.diff(is_digit.view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if len(starts) == 0:
+        return array("q")
+    width = int((ends - starts).max())
+    if width > 18:
+        return None
+
+    # Schéma de Horner colonne par colonne, chaque suite alignée à droite
+    # sur width chiffres (les positions avant son début comptent pour 0).
+    values = np.zeros(len(starts), dtype=np.int64)
+    for k in range(width, 0, -1):
+        idx = ends - k
+        digit = buf[np.maximum(idx, 0)].astype(np.int64) - 48
+        values = values * 10 + np.where(idx >= starts, digit, 0)
+
+    out = array("q")
+    out.frombytes(values.tobytes())
+    return out
+
+
+# Blancs reconnus par bytes.split().
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+
+def split_ints(data: bytes, seps: bytes = b"") -> Union[array, List[int]]:
+    """
+    Tous les entiers de data, séparés par des blancs ou par un des
+    octets de seps (ex. b",-"). Les entiers négatifs ne sont pas gérés
+    si b"-" fait partie des séparateurs. Tout autre octet lève ValueError.
+    Rend une liste d'int Python si une valeur ne tient pas dans un int64.
+    """
+    # Le chemin NumPy ne voit que des chiffres et des séparateurs : s'il
+    # reste autre chose (signe, lettre...), on laisse int() trancher.
+    if np is not None and len(data) >= NUMPY_MIN_BYTES and not data.translate(None, b"0123456789" + _WHITESPACE + seps):
+        values = _digit_runs_numpy(data)
+        if values is not None:
+            return values
+    for sep in seps:
+        data = data.replace(bytes((sep,)), b" ")
+    numbers = list(map(int, data.split()))
+    try:
+        return array("q", numbers)
+    except OverflowError:
+        return numbers
+
+
+def read_ints(path: PathLike, seps: bytes = b"") -> Union[array, List[int]]:
+    return split_ints(read_bytes(path), seps)
+
+
+def read_int_tuples(path: PathLike, width: int, sep: bytes = b",") -> List[Tuple[int, ...]]:
+    """Lignes 'a,b,c' -> [(a, b, c), ...] ; vérifie que chaque ligne a width champs."""
+    data = read_bytes(path)
+    values = split_ints(data, sep)
+    fields = data
+    for s in sep:
+        fields = fields.replace(bytes((s,)), b" ")
+    if {len(line.split()) for line in fields.splitlines()} - {0, width}:
+        raise ValueError(f"{path}: attendu {width} entiers par ligne")
+    it = iter(values)
+    return list(zip(*([it] * width)))
+
+
+def read_lines(path: PathLike) -> List[str]:
+    """Toutes les lignes, sans le '\\n' final, espaces conservés."""
+    return read_bytes(path).decode("utf-8").splitlines()
+
+
+def read_nonempty_lines(path: PathLike) -> List[str]:
+    """Lignes non vides, sans blancs autour."""
+    return [s for s in (line.strip() for line in read_bytes(path).decode("utf-8").splitlines()) if s]
+
+
+def read_letter_numbers(path: PathLike) -> Tuple[List[str], Union[array, List[int]]]:
+    """Lignes 'L68' -> (['L', ...], array('q', [68, ...]))."""
+    data = read_bytes(path)
+    letters = list(data.translate(None, b"0123456789 \t\r\n").decode("ascii"))
+    numbers = split_ints(data.translate(None, b"LR"))
+    if len(letters) != len(numbers):
+        raise ValueError(f"{path}: rotation mal formée")
+    return letters, numbers
+
+
+def read_range_pairs(path: PathLike) -> Tuple[Union[array, List[int]], Union[array, List[int]]]:
+    """'a-b,c-d,...' (virgule finale tolérée) -> (débuts, fins)."""
+    values = read_ints(path, b",-")
+    if len(values) % 2:
+        raise ValueError(f"{path}: nombre impair de bornes")
+    return values[0::2], values[1::2]
+
+
+def read_adjacency(path: PathLike) -> Dict[str, List[str]]:
+    """Lignes 'src: dst1 dst2 ...' -> {src: [dst1, dst2, ...]}."""
+    graph: Dict[str, List[str]] = {}
+    for line in read_bytes(path).decode("utf-8").splitlines():
+        left, sep, right = line.partition(":")
+        if not sep:
+            continue
+        graph[left.strip()] = right.split()
+    return graph
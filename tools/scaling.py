@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Mode "courbe de complexité" : chaque solveur est lancé sur une échelle
+géométrique d'entrées générées, et on ajuste la pente log-log du temps
+en fonction de la taille. Une pente au-dessus du budget est signalée.
+
+Usage :
+
+    python -m tools.scaling --days 1 2 8 --steps 5 --output scaling.json
+    python -m tools.scaling --compare scaling.json     # compare à une baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from tools.bench import quiet, time_phase
+from tools.generators import write_input
+from tools.solvers import SolverSpec, discover, load_module, run_parse, run_solve
+
+
+@dataclass(frozen=True)
+class ScalingPlan:
+    """
+    Quelle grandeur faire varier pour un jour donné.
+    param : nom du paramètre du générateur ('size' ou autre, ex. 'width').
+    start : première valeur de l'échelle ; factor : raison géométrique.
+    fixed : autres paramètres passés tels quels au générateur.
+    samples : entrées indépendantes (graines différentes) par échelon ; on
+    garde la médiane de leurs temps. Utile quand le coût d'un élément varie
+    beaucoup d'un tirage à l'autre.
+    """
+    param: str
+    start: int
+    factor: float = 2.0
+    fixed: Dict[str, Any] = field(default_factory=dict)
+    samples: int = 1
+
+    def ladder(self, steps: int) -> List[int]:
+        values: List[int] = []
+        for i in range(steps):
+            v = int(round(self.start * self.factor ** i))
+            if values and v <= values[-1]:
+                v = values[-1] + 1
+            values.append(v)
+        return values
+
+
+PLANS: Dict[int, ScalingPlan] = {
+    1: ScalingPlan("size", 2000),
+    2: ScalingPlan("width", 200, fixed={"size": 5}),
+    3: ScalingPlan("size", 50),
+    4: ScalingPlan("size", 16),
+    5: ScalingPlan("size", 500),
+    6: ScalingPlan("size", 50),
+    7: ScalingPlan("size", 32),
+    8: ScalingPlan("size", 50),
+    9: ScalingPlan("size", 20),
+    # Le coût d'une machine est très dispersé (quelques-unes coûtent 100x la
+    # médiane) : pressions bornées, grandes échelles et plusieurs tirages.
+    10: ScalingPlan("size", 32, fixed={"max_press": 5}, samples=5),
+    11: ScalingPlan("size", 200),
+    # Exponentiel en la taille des régions : on fait croître leurs dimensions.
+    12: ScalingPlan("max_dim", 4, factor=1.25, fixed={"size": 2, "min_dim": 4}),
+}
+
+# Exposant maximal toléré, par solveur, par rapport au paramètre du plan.
+DEFAULT_BUDGET = 1.5
+BUDGETS: Dict[str, float] = {
+    "day4/solution1": 2.3,   # taille = côté de la grille
+    "day4/solution2": 3.3,
+    "day7/solution1": 2.3,
+    "day7/solution2": 2.3,
+    "day8/solution1": 2.3,
+    "day8/solution2": 2.5,
+    "day9/solution1": 2.3,
+    "day9/solution2": 3.3,
+    "day12/solution": 4.0,
+}
+
+
+def fit_exponent(points: List[Tuple[int, float]]) -> float:
+    """Pente des moindres carrés de log(temps) en fonction de log(taille)."""
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(max(t, 1e-9)) for _, t in points]
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    var = sum((x - mx) ** 2 for x in xs)
+    if var == 0:
+        return 0.0
+    return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var
+
+
+def measure_curve(
+    spec: SolverSpec,
+    steps: int,
+    repeat: int,
+    seed: int,
+    workdir: Path,
+) -> List[Tuple[int, float]]:
+    """Temps médian (parse + solve) pour chaque échelon du plan du jour."""
+    plan = PLANS[spec.day]
+    module = load_module(spec)
+    points: List[Tuple[int, float]] = []
+
+    for value in plan.ladder(steps):
+        params = dict(plan.fixed)
+        params[plan.param] = value
+        size = params.pop("size", value)
+        times: List[float] = []
+        for k in range(plan.samples):
+            path = write_input(spec.day, size, workdir / f"day{spec.day}_{value}_{k}.txt", seed + k, **params)
+
+            def run():
+                return run_solve(spec, module, run_parse(spec, module, path))
+
+            with quiet():
+                samples, _ = time_phase(run, repeat, warmup=0)
+            samples.sort()
+            times.append(samples[len(samples) // 2])
+        times.sort()
+        points.append((value, times[len(times) // 2]))
+
+    return points
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Liste des solveurs dont l'exposant a augmenté de plus de tolerance."""
+    regressions: List[str] = []
+    for name, res in current.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        delta = res["exponent"] - old["exponent"]
+        res["baseline_exponent"] = old["exponent"]
+        if delta > tolerance:
+            regressions.append(name)
+    return regressions
+
+
+def format_report(results: Dict[str, Any]) -> str:
+    header = f"{'solver':<16} {'param':<8} {'range':<14} {'exponent':>9} {'budget':>7} {'baseline':>9}  status"
+    lines = [header, "-" * len(header)]
+    for name, res in results.items():
+        sizes = [n for n, _ in res["points"]]
+        base = res.get("baseline_exponent")
+        base_str = f"{base:.2f}" if base is not None else "-"
+        lines.append(
+            f"{name:<16} {res['param']:<8} {f'{sizes[0]}..{sizes[-1]}':<14} "
+            f"{res['exponent']:>9.2f} {res['budget']:>7.2f} {base_str:>9}  {res['status']}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ajuste l'exposant de complexité empirique de chaque solveur.")
+    parser.add_argument("--days", type=int, nargs="*", help="jours à mesurer (défaut : tous)")
+    parser.add_argument("--steps", type=int, default=4, help="nombre d'échelons de l'échelle géométrique")
+    parser.add_argument("--repeat", type=int, default=3, help="exécutions par échelon (on garde la médiane)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", action="append", default=[], metavar="SOLVER=EXP",
+                        help="surcharge un budget, ex. day8/solution2=2.2")
+    parser.add_argument("--output", type=Path, help="écrit les résultats (baseline) en JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON à comparer")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="hausse d'exposant tolérée vs baseline")
+    args = parser.parse_args()
+
+    budgets = dict(BUDGETS)
+    for item in args.budget:
+        name, value = item.split("=", 1)
+        budgets[name] = float(value)
+
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for spec in discover(args.days):
+            points = measure_curve(spec, args.steps, args.repeat, args.seed, Path(tmp))
+            exponent = fit_exponent(points)
+            budget = budgets.get(spec.name, DEFAULT_BUDGET)
+            results[spec.name] = {
+                "param": PLANS[spec.day].param,
+                "points": points,
+                "exponent": exponent,
+                "budget": budget,
+                "status": "OVER BUDGET" if exponent > budget else "ok",
+            }
+
+    regressions: List[str] = []
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline.get("results", baseline), args.tolerance)
+        for name in regressions:
+            results[name]["status"] += " / REGRESSION"
+
+    print(format_report(results))
+
+    if args.output:
+        payload = {"steps": args.steps, "seed": args.seed, "results": results}
+        args.output.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    if regressions or any(r["exponent"] > r["budget"] for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
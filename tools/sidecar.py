@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Fichiers "sidecar" binaires : une entrée texte déjà parsée, stockée à côté
+d'elle (inputs.txt -> inputs.txt.aocbin) sous forme de tableaux bruts
+int64 / uint8 précédés d'un petit en-tête. Le fichier est projetable en
+mémoire : charger un sidecar revient à un memcpy, sans aucun parsing texte.
+
+Le sidecar n'est utilisé que s'il correspond encore au texte : l'en-tête
+enregistre la taille et la date de modification (ns) du fichier source.
+
+Les solutions qui le supportent exposent to_sidecar(data) et
+from_sidecar(arrays), et appellent load_sidecar() dans leur parser.
+
+Usage (étape de "compilation", optionnelle) :
+
+    python -m tools.sidecar --days 1 5 8
+    python -m tools.sidecar --days 8 --input big_inputs.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+MAGIC = b"AOCB"
+VERSION = 1
+SUFFIX = ".aocbin"
+
+# magic, version, taille source, mtime_ns source, nb tableaux, padding
+_HEADER = struct.Struct("<4sIQQII")
+# nom, typecode, padding, nombre d'éléments
+_ENTRY = struct.Struct("<24sc7xQ")
+_TYPECODES = {b"q": 8, b"B": 1}
+
+PathLike = Union[str, Path]
+
+
+def sidecar_path(text_path: PathLike) -> Path:
+    text_path = Path(text_path)
+    return text_path.with_name(text_path.name + SUFFIX)
+
+
+def _align8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def write_sidecar(text_path: PathLike, arrays: Dict[str, array]) -> Path:
+    """Écrit les tableaux (typecode 'q' ou 'B') dans le sidecar de text_path."""
+    st = os.stat(text_path)
+    out = sidecar_path(text_path)
+
+    header = _HEADER.pack(MAGIC, VERSION, st.st_size, st.st_mtime_ns, len(arrays), 0)
+    entries = b""
+    for name, arr in arrays.items():
+        if arr.typecode.encode() not in _TYPECODES:
+            raise ValueError(f"Typecode non supporté pour {name!r} : {arr.typecode!r}")
+        entries += _ENTRY.pack(name.encode("ascii"), arr.typecode.encode(), len(arr))
+
+    tmp = out.with_suffix(out.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(entries)
+        for arr in arrays.values():
+            f.write(b"\0" * (_align8(f.tell()) - f.tell()))
+            f.write(arr.tobytes())
+    os.replace(tmp, out)
+    return out
+
+
+def _read_layout(mm, st: os.stat_result) -> Optional[List[Tuple[str, str, int, int]]]:
+    """
+    Vérifie l'en-tête et la table des tableaux ; retourne pour chacun
+    (nom, typecode, position, nombre d'octets), ou None si le fichier est
+    périmé, tronqué ou incohérent.
+    """
+    if len(mm) < _HEADER.size:
+        return None
+    magic, version, size, mtime_ns, count, _ = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != VERSION or size != st.st_size or mtime_ns != st.st_mtime_ns:
+        return None
+
+    offset = _HEADER.size
+    if offset + count * _ENTRY.size > len(mm):
+        return None
+    entries = []
+    for _ in range(count):
+        raw_name, typecode, length = _ENTRY.unpack_from(mm, offset)
+        if typecode not in _TYPECODES:
+            return None
+        try:
+            name = raw_name.rstrip(b"\0").decode("ascii")
+        except UnicodeDecodeError:
+            return None
+        entries.append((name, typecode.decode(), length * _TYPECODES[typecode]))
+        offset += _ENTRY.size
+
+    layout = []
+    for name, typecode, nbytes in entries:
+        offset = _align8(offset)
+        if offset + nbytes > len(mm):
+            return None
+        layout.append((name, typecode, offset, nbytes))
+        offset += nbytes
+    return layout
+
+
+def load_sidecar(
+    text_path: PathLike,
+    required: Iterable[str] = (),
+    copy: bool = True,
+) -> Optional[Dict[str, Union[array, memoryview]]]:
+    """
+    Charge le sidecar de text_path s'il existe et correspond encore au texte
+    (même taille, même mtime) et contient tous les tableaux required.
+    Sinon retourne None : l'appelant parse le texte normalement.
+
+    copy=False renvoie des memoryview sur le fichier projeté (zéro copie) ;
+    le mmap reste ouvert tant qu'une vue est référencée.
+    """
+    path = sidecar_path(text_path)
+    try:
+        st = os.stat(text_path)
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+
+    layout = _read_layout(mm, st)
+    if layout is None:
+        mm.close()
+        return None
+
+    arrays: Dict[str, Union[array, memoryview]] = {}
+    view = memoryview(mm)
+    for name, typecode, offset, nbytes in layout:
+        if copy:
+            arr = array(typecode)
+            with view[offset : offset + nbytes] as chunk:
+                arr.frombytes(chunk)
+            arrays[name] = arr
+        else:
+            arrays[name] = view[offset : offset + nbytes].cast(typecode)
+
+    if copy:
+        view.release()
+        mm.close()
+
+    if any(name not in arrays for name in required):
+        return None
+    return arrays
+
+
+def compile_inputs(days: Optional[List[int]], input_name: str) -> List[Path]:
+    """Pour chaque jour qui le supporte, parse le texte et écrit son sidecar."""
+    from tools.solvers import discover, load_module, run_parse
+
+    written: List[Path] = []
+    done = set()
+    for spec in discover(days):
+        module = load_module(spec)
+        if not hasattr(module, "to_sidecar"):
+            continue
+        text_path = spec.path.parent / input_name
+        # Un seul sidecar par fichier : la première solution du jour qui le supporte l'écrit.
+        if text_path in done or not text_path.exists():
+            continue
+        sidecar_path(text_path).unlink(missing_ok=True)  # force un parse texte
+        data = run_parse(spec, module, text_path)
+        written.append(write_sidecar(text_path, module.to_sidecar(data)))
+        done.add(text_path)
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pré-parse les entrées texte en sidecars binaires.")
+    parser.add_argument("--days", type=int, nargs="*", help="jours à compiler (défaut : tous ceux qui le supportent)")
+    parser.add_argument("--input", default="inputs.txt", help="nom du fichier d'entrée dans chaque dossier dayN")
+    args = parser.parse_args()
+
+    for path in compile_inputs(args.days, args.input):
+        print(f"{path} ({path.stat().st_size / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class SolverSpec:
+    """
+    Décrit comment découper une solution dayN/solutionX.py en deux phases :
+    - parse : nom de la fonction qui lit le fichier d'entrée,
+    - solve : nom de la fonction qui calcule la réponse à partir du parse.
+
+    unpack : si True, le résultat du parse (un tuple) est passé en *args.
+    pick   : si la fonction solve renvoie un tuple, index de la réponse.
+    """
+    day: int
+    filename: str
+    parse: str
+    solve: str
+    unpack: bool = False
+    pick: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        return f"day{self.day}/{Path(self.filename).stem}"
+
+    @property
+    def path(self) -> Path:
+        return REPO_ROOT / f"day{self.day}" / self.filename
+
+
+# Table des points d'entrée connus, indexée par (jour, fichier).
+SPECS: Dict[Tuple[int, str], SolverSpec] = {
+    (s.day, s.filename): s
+    for s in [
+        SolverSpec(1, "solution1.py", "read_file_split_letters_numbers", "get_solution", unpack=True),
+        SolverSpec(1, "solution2.py", "read_file_split_letters_numbers", "get_solution", unpack=True),
+        SolverSpec(2, "solution1.py", "parse_ranges_from_file", "start_analysing", unpack=True),
+        SolverSpec(2, "solution2.py", "parse_ranges_from_file", "start_analysing", unpack=True),
+        SolverSpec(3, "solution1.py", "parse_numbers_from_file", "start_analysing"),
+        SolverSpec(3, "solution2.py", "parse_numbers_from_file", "start_analysing"),
+        SolverSpec(4, "solution1.py", "read_input_file", "find_accessible_rolls", pick=0),
+        SolverSpec(4, "solution2.py", "read_input_file", "simulate_removals", pick=0),
+        SolverSpec(5, "solution1.py", "parse_input", "count_fresh_ids_fast", unpack=True),
+        SolverSpec(5, "solution2.py", "parse_ranges_only", "count_total_fresh_ids"),
+        SolverSpec(6, "solution1.py", "read_input_file", "solve_worksheets"),
+        SolverSpec(6, "solution2.py", "read_input_file", "solve_worksheets"),
+        SolverSpec(7, "solution1.py", "read_grid", "simulate_splits"),
+        SolverSpec(7, "solution2.py", "read_grid", "count_timelines"),
+        SolverSpec(8, "solution1.py", "read_points", "solve_points"),
+        SolverSpec(8, "solution2.py", "read_points", "solve_points"),
+        SolverSpec(9, "solution1.py", "read_points", "max_rectangle_area", pick=0),
+        SolverSpec(9, "solution2.py", "read_red_points", "max_rectangle_area_red_green", pick=0),
+        SolverSpec(10, "solution1.py", "read_machines", "solve_machines"),
+        SolverSpec(10, "solution2.py", "read_machines", "solve_machines"),
+        SolverSpec(11, "solution1.py", "read_graph", "count_paths"),
+        SolverSpec(11, "solution2.py", "read_graph", "count_paths"),
+        SolverSpec(12, "solution.py", "parse_input", "count_packable_regions", unpack=True),
+    ]
+}
+
+
+def discover(days: Optional[List[int]] = None) -> List[SolverSpec]:
+    """
+    Parcourt les dossiers day*/solution*.py à la racine du dépôt et
+    retourne les specs correspondantes, triées par jour puis par fichier.
+    Un fichier sans entrée dans SPECS lève une erreur : il faut l'ajouter.
+    """
+    found: List[SolverSpec] = []
+    for path in REPO_ROOT.glob("day*/solution*.py"):
+        m = re.fullmatch(r"day(\d+)", path.parent.name)
+        if not m:
+            continue
+        day = int(m.group(1))
+        if days is not None and day not in days:
+            continue
+        key = (day, path.name)
+        if key not in SPECS:
+            raise KeyError(f"Aucune spec de benchmark pour {path.parent.name}/{path.name}")
+        found.append(SPECS[key])
+
+    found.sort(key=lambda s: (s.day, s.filename))
+    return found
+
+
+def get_spec(name: str) -> SolverSpec:
+    """Retrouve une spec à partir de son nom, ex. 'day8/solution2'."""
+    for spec in SPECS.values():
+        if spec.name == name:
+            return spec
+    raise KeyError(f"Solveur inconnu : {name!r}")
+
+
+_modules: Dict[Path, ModuleType] = {}
+
+
+def load_module(spec: SolverSpec) -> ModuleType:
+    """
+    Importe dayN/solutionX.py sous un nom unique (dayN_solutionX).
+    Le dossier du jour est ajouté au sys.path pour les imports voisins.
+    """
+    path = spec.path
+    if path in _modules:
+        return _modules[path]
+
+    module_name = f"day{spec.day}_{path.stem}"
+    day_dir = str(path.parent)
+    if day_dir not in sys.path:
+        sys.path.insert(0, day_dir)
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    import_spec = importlib.util.spec_from_file_location(module_name, path)
+    if import_spec is None or import_spec.loader is None:
+        raise ImportError(f"Impossible d'importer {path}")
+    module = importlib.util.module_from_spec(import_spec)
+    sys.modules[module_name] = module
+    import_spec.loader.exec_module(module)
+
+    _modules[path] = module
+    return module
+
+
+def run_parse(spec: SolverSpec, module: ModuleType, input_path: Path) -> Any:
+    return getattr(module, spec.parse)(str(input_path))
+
+
+def run_solve(spec: SolverSpec, module: ModuleType, data: Any, params: Optional[Dict[str, Any]] = None) -> Any:
+    """params : arguments nommés optionnels du solve, ex. {"connections": 10} pour day8."""
+    fn = getattr(module, spec.solve)
+    params = params or {}
+    result = fn(*data, **params) if spec.unpack else fn(data, **params)
+    if spec.pick is not None:
+        result = result[spec.pick]
+    return result